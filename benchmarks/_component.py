@@ -0,0 +1,26 @@
+"""Import the Pushup Tracker engine modules without Home Assistant.
+
+The integration package ``__init__`` imports Home Assistant, but the engine
+modules only depend on each other. This registers a bare package pointing at
+the component directory so ``pushup_tracker.engine`` and friends import on a
+plain Python install.
+"""
+
+import importlib
+from pathlib import Path
+import sys
+import types
+
+COMPONENT_DIR = (
+    Path(__file__).resolve().parent.parent / "custom_components" / "pushup_tracker"
+)
+PACKAGE = "pushup_tracker"
+
+
+def load(module: str):
+    """Return ``pushup_tracker.<module>`` imported from the component directory."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(COMPONENT_DIR)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{module}")
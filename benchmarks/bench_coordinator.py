@@ -0,0 +1,157 @@
+"""Event loop cost of many trackers: per-tracker timers vs the coordinator.
+
+Runs N engine-backed trackers on a real asyncio loop for a few seconds, each
+doing a rep every couple of seconds, and reports timer callbacks per second,
+CPU time per second of wall time and the worst lag of a probe sleeping on
+the same loop.
+
+    python benchmarks/bench_coordinator.py --trackers 10 50 100
+"""
+
+import argparse
+import asyncio
+import math
+import time
+
+from _component import load
+
+const = load("const")
+engine_module = load("engine")
+coordinator_module = load("coordinator")
+
+REP_PERIOD = 2.2  # seconds between reps of one tracker
+
+
+class TimerTracker:
+    """A tracker that arms its own timer, like one sensor per entity."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, stats: dict) -> None:
+        """Initialize the tracker."""
+        self.engine = engine_module.PushupEngine()
+        self._loop = loop
+        self._stats = stats
+        self._handle = None
+
+    def rep(self, now: float) -> None:
+        """Start a boost and make sure the timer runs."""
+        self.engine.envelope.add(now)
+        self.schedule(const.UPDATE_INTERVAL)
+
+    def schedule(self, delay: float | None) -> None:
+        """Replace the pending timer."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if delay is not None:
+            self._handle = self._loop.call_later(delay, self._fire)
+
+    def _fire(self) -> None:
+        """Advance the envelope."""
+        self._handle = None
+        self._stats["callbacks"] += 1
+        now = time.monotonic()
+        self.engine.output(now)
+        self.schedule(
+            self.engine.envelope.next_update_delay(now, const.UPDATE_INTERVAL)
+        )
+
+
+class CoordinatedTracker:
+    """A tracker ticked by the shared coordinator."""
+
+    def __init__(self, coordinator, stats: dict) -> None:
+        """Initialize the tracker."""
+        self.engine = engine_module.PushupEngine()
+        self._coordinator = coordinator
+        self._stats = stats
+
+    def rep(self, now: float) -> None:
+        """Start a boost and make sure the tracker is ticked."""
+        self.engine.envelope.add(now)
+        self._coordinator.async_schedule(self, const.UPDATE_INTERVAL)
+
+    def async_tick(self, now: float) -> float | None:
+        """Advance the envelope."""
+        self._stats["trackers_ticked"] += 1
+        self.engine.output(now)
+        return self.engine.envelope.next_update_delay(now, const.UPDATE_INTERVAL)
+
+
+async def probe_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Return the worst oversleep of a short sleep loop, in milliseconds."""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.monotonic()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.monotonic() - started - interval)
+    return worst * 1000
+
+
+async def run(mode: str, count: int, duration: float, active: float) -> dict:
+    """Run ``count`` trackers for ``duration`` seconds."""
+    loop = asyncio.get_running_loop()
+    stats = {"callbacks": 0, "trackers_ticked": 0}
+    coordinator = coordinator_module.PushupCoordinator(loop)
+    if mode == "timers":
+        trackers = [TimerTracker(loop, stats) for _ in range(count)]
+    else:
+        trackers = [CoordinatedTracker(coordinator, stats) for _ in range(count)]
+    exercising = trackers[: math.ceil(count * active)]
+
+    stop = asyncio.Event()
+    lag = asyncio.ensure_future(probe_lag(stop))
+    started = time.monotonic()
+    cpu_started = time.process_time()
+    next_rep = [
+        started + REP_PERIOD * index / max(len(exercising), 1)
+        for index in range(len(exercising))
+    ]
+    while (now := time.monotonic()) - started < duration:
+        for index, tracker in enumerate(exercising):
+            if now >= next_rep[index]:
+                tracker.rep(now)
+                next_rep[index] += REP_PERIOD
+        await asyncio.sleep(0.05)
+    cpu = time.process_time() - cpu_started
+    elapsed = time.monotonic() - started
+    stop.set()
+    worst_lag = await lag
+    if mode == "timers":
+        for tracker in trackers:
+            tracker.schedule(None)
+    coordinator.async_stop()
+
+    if mode == "coordinator":
+        stats["callbacks"] = coordinator.ticks
+    return {
+        "callbacks_per_sec": stats["callbacks"] / elapsed,
+        "cpu_ms_per_sec": cpu / elapsed * 1000,
+        "worst_lag_ms": worst_lag,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trackers", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--active", type=float, default=0.5, help="share of trackers doing reps"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'trackers':>8} {'mode':>12} {'timer cb/s':>11} {'cpu ms/s':>9} "
+        f"{'worst lag ms':>13}"
+    )
+    for count in args.trackers:
+        for mode in ("timers", "coordinator"):
+            result = asyncio.run(run(mode, count, args.duration, args.active))
+            print(
+                f"{count:>8} {mode:>12} {result['callbacks_per_sec']:>11.1f} "
+                f"{result['cpu_ms_per_sec']:>9.2f} {result['worst_lag_ms']:>13.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
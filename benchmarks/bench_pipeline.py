@@ -0,0 +1,198 @@
+"""Offline replay benchmark for the Pushup Tracker pipeline.
+
+Feeds a distance trace through calibration, rep detection and the boost
+envelope exactly as the sensor does, without Home Assistant, and reports
+throughput, per-sample latency percentiles, boost store memory and the
+detected rep count against ground truth.
+
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --trace recorded.csv --expected-reps 120
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from _component import load
+import traces
+
+const = load("const")
+engine_module = load("engine")
+parameters_module = load("parameters")
+
+TICK_INTERVAL = 0.1  # seconds between envelope evaluations, like the live timer
+
+
+def percentiles(samples_ns: list[int]) -> dict[str, float]:
+    """Return p50/p95/p99/max of nanosecond samples in microseconds."""
+    if not samples_ns:
+        return {}
+    ordered = sorted(samples_ns)
+    last = len(ordered) - 1
+    return {
+        name: ordered[round(last * fraction)] / 1000
+        for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1))
+    }
+
+
+def replay(
+    timestamps, distances, calibration: float, parameters, trace_memory: bool
+) -> dict:
+    """Replay a trace sample by sample and time every stage.
+
+    Tracing allocations slows every call down, so timings and peak memory
+    come from separate runs.
+    """
+    engine = engine_module.PushupEngine(parameters)
+    perf = time.perf_counter_ns
+    calibration_ns = []
+    detection_ns = []
+    tick_ns = []
+    reps = 0
+    peak_boosts = 0
+    next_tick = timestamps[0] if timestamps else 0.0
+
+    if trace_memory:
+        tracemalloc.start()
+    engine.start_calibration()
+    started = perf()
+    for timestamp, distance in zip(timestamps, distances):
+        if engine.calibrating and timestamp >= calibration:
+            engine.stop_calibration()
+        if engine.calibrating:
+            begin = perf()
+            engine.update_calibration(engine.filter(distance))
+            calibration_ns.append(perf() - begin)
+            continue
+
+        begin = perf()
+        if engine.process_sample(timestamp, engine.filter(distance)):
+            reps += 1
+        detection_ns.append(perf() - begin)
+
+        while next_tick <= timestamp:
+            begin = perf()
+            engine.output(next_tick)
+            tick_ns.append(perf() - begin)
+            peak_boosts = max(peak_boosts, len(engine.envelope))
+            next_tick += TICK_INTERVAL
+    elapsed = (perf() - started) / 1e9
+    peak_memory = None
+    if trace_memory:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "samples": len(distances),
+        "elapsed": elapsed,
+        "reps": reps,
+        "calibration_us": percentiles(calibration_ns),
+        "detection_us": percentiles(detection_ns),
+        "tick_us": percentiles(tick_ns),
+        "peak_boosts": peak_boosts,
+        "boost_store_bytes": engine.envelope.nbytes,
+        "peak_traced_bytes": peak_memory,
+        "range": (engine.min_distance, engine.max_distance),
+    }
+
+
+def replay_batch(
+    timestamps, distances, calibration: float, parameters, vectorized: bool
+) -> dict:
+    """Replay a trace through the batch API."""
+    split = next(
+        (index for index, value in enumerate(timestamps) if value >= calibration),
+        len(timestamps),
+    )
+    engine = engine_module.PushupEngine(parameters)
+    started = time.perf_counter()
+    engine.start_calibration()
+    engine.process_samples(timestamps[:split], distances[:split], vectorized)
+    engine.stop_calibration()
+    rep_times = engine.process_samples(
+        timestamps[split:], distances[split:], vectorized
+    )
+    if timestamps:
+        end = timestamps[-1]
+        grid = [
+            timestamps[0] + index * TICK_INTERVAL
+            for index in range(int((end - timestamps[0]) / TICK_INTERVAL) + 1)
+        ]
+        engine.envelope_output(rep_times, grid, vectorized)
+    elapsed = time.perf_counter() - started
+    return {"samples": len(distances), "elapsed": elapsed, "reps": len(rep_times)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trace", help="CSV or NPY trace; synthetic if omitted")
+    parser.add_argument("--expected-reps", type=int, help="ground truth for --trace")
+    parser.add_argument("--duration", type=float, default=600.0)
+    parser.add_argument("--rate", type=float, default=50.0)
+    parser.add_argument("--spike-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--filter", choices=const.FILTER_TYPES, default=const.DEFAULT_FILTER_TYPE
+    )
+    parser.add_argument(
+        "--filter-window", type=int, default=const.DEFAULT_FILTER_WINDOW
+    )
+    parser.add_argument(
+        "--calibration",
+        type=float,
+        default=10.0,
+        help="seconds at the start of the trace used for calibration",
+    )
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        timestamps, distances, expected = traces.load(args.trace, args.expected_reps)
+    else:
+        timestamps, distances, expected = traces.synthetic(
+            duration=args.duration,
+            rate=args.rate,
+            spike_rate=args.spike_rate,
+            calibration=args.calibration,
+        )
+    if timestamps:
+        offset = timestamps[0]
+        timestamps = [timestamp - offset for timestamp in timestamps]
+
+    parameters = parameters_module.PushupParameters(
+        filter_type=args.filter, filter_window=args.filter_window
+    )
+    result = replay(timestamps, distances, args.calibration, parameters, False)
+    memory = replay(timestamps, distances, args.calibration, parameters, True)
+    print(f"samples            {result['samples']}")
+    print(f"samples/sec        {result['samples'] / result['elapsed']:,.0f}")
+    for stage in ("calibration_us", "detection_us", "tick_us"):
+        stats = "  ".join(f"{k}={v:.2f}" for k, v in result[stage].items())
+        print(f"{stage:<18} {stats}")
+    print(f"peak boosts        {result['peak_boosts']}")
+    print(f"boost store bytes  {result['boost_store_bytes']}")
+    print(f"peak traced bytes  {memory['peak_traced_bytes']}")
+    print(f"calibrated range   {result['range']}")
+    print(f"reps detected      {result['reps']}")
+    if expected is not None:
+        print(f"reps expected      {expected}  (error {result['reps'] - expected:+d})")
+
+    for vectorized in (False, True):
+        if vectorized and engine_module.np is None:
+            continue
+        batch = replay_batch(
+            timestamps, distances, args.calibration, parameters, vectorized
+        )
+        label = "batch numpy" if vectorized else "batch scalar"
+        print(
+            f"{label:<18} {batch['samples'] / batch['elapsed']:,.0f} samples/sec"
+            f"  reps={batch['reps']}"
+        )
+
+    if expected is not None and result["reps"] != expected:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Full-stack load test of Pushup Tracker inside a simulated Home Assistant.
+
+Sets up N trackers through their config entries with the
+pytest-homeassistant-custom-component harness, drives every input entity
+with synthetic distance states at M Hz and checks event loop lag, the time
+spent in the trackers' own handlers per sample and state writes per second
+against budgets.
+
+    pip install pytest-homeassistant-custom-component
+    pytest benchmarks/load_test.py -s
+    LOAD_TRACKERS=50 LOAD_RATE=25 pytest benchmarks/load_test.py -s
+
+Raise ``LOAD_TRACKERS`` until a budget fails to find how many trackers a host
+sustains. Every ``LOAD_*`` setting below can be overridden the same way.
+"""
+
+import asyncio
+import math
+import os
+from pathlib import Path
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.const import CONF_NAME  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.setup import async_setup_component  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+)
+
+# Home Assistant finds custom integrations in the ``custom_components``
+# package, which lives next to this directory.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.pushup_tracker.const import (  # noqa: E402
+    CONF_INPUT_ENTITIES,
+    DEFAULT_MAX_UPDATE_RATE,
+    DOMAIN,
+)
+
+TRACKERS = int(os.environ.get("LOAD_TRACKERS", 10))
+RATE = float(os.environ.get("LOAD_RATE", 25))  # samples per second per tracker
+DURATION = float(os.environ.get("LOAD_DURATION", 10))  # seconds of load
+REP_PERIOD = 2.0  # seconds per synthetic rep
+
+MAX_LOOP_LAG_MS = float(os.environ.get("LOAD_MAX_LOOP_LAG_MS", 50))
+# Input handling and ticks of the trackers themselves, not the test harness.
+# A desktop host measures 20-35 µs per sample including state writes; the
+# budget leaves headroom for slower hosts.
+MAX_HANDLER_US_PER_SAMPLE = float(os.environ.get("LOAD_MAX_HANDLER_US_PER_SAMPLE", 200))
+# The coalescer caps each tracker at its max update rate.
+MAX_WRITES_PER_SECOND = float(
+    os.environ.get("LOAD_MAX_WRITES_PER_SECOND", DEFAULT_MAX_UPDATE_RATE * 1.1)
+)
+
+PROBE_INTERVAL = 0.01  # seconds between event loop lag probes
+BOTTOM, TOP = 0.1, 0.4  # metres; the calibrated range of every tracker
+
+
+def distance(now: float, phase: float) -> float:
+    """Return the synthetic distance of one tracker at ``now``."""
+    wave = math.cos(2 * math.pi * (now / REP_PERIOD + phase))
+    return BOTTOM + (TOP - BOTTOM) * (wave + 1) / 2
+
+
+async def probe_loop_lag(stop: asyncio.Event) -> float:
+    """Return the worst lateness of a short sleep, in seconds."""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.monotonic()
+        await asyncio.sleep(PROBE_INTERVAL)
+        worst = max(worst, time.monotonic() - started - PROBE_INTERVAL)
+    return worst
+
+
+async def test_load(hass: HomeAssistant, enable_custom_integrations) -> None:
+    """Drive N trackers at M Hz and check the budgets."""
+    entries = []
+    inputs = []
+    for index in range(TRACKERS):
+        input_entity = f"sensor.load_distance_{index}"
+        hass.states.async_set(input_entity, str(TOP))
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=2,
+            title=f"Load {index}",
+            data={CONF_NAME: f"Load {index}", CONF_INPUT_ENTITIES: [input_entity]},
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+        inputs.append((input_entity, index / TRACKERS))
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    for entry in entries:
+        entry_data = hass.data[DOMAIN][entry.entry_id]
+        entry_data["sensor"].engine.set_calibration(BOTTOM, TOP)
+
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(stop))
+    started = time.monotonic()
+    step = 0
+    while (now := time.monotonic()) - started < DURATION:
+        for input_entity, phase in inputs:
+            hass.states.async_set(input_entity, f"{distance(now, phase):.4f}")
+        step += 1
+        await asyncio.sleep(max(0.0, started + step / RATE - time.monotonic()))
+    await hass.async_block_till_done()
+    elapsed = time.monotonic() - started
+    stop.set()
+    loop_lag = await probe
+
+    stats = [hass.data[DOMAIN][entry.entry_id]["stats"] for entry in entries]
+    samples = sum(tracker.samples for tracker in stats)
+    writes = sum(tracker.state_writes for tracker in stats)
+    handler_ns = sum(
+        tracker.input_time.total_ns + tracker.tick_time.total_ns for tracker in stats
+    )
+    reps = sum(
+        hass.data[DOMAIN][entry.entry_id]["history"].total_reps for entry in entries
+    )
+    handler_per_sample = handler_ns / samples / 1000
+    writes_per_second = writes / elapsed / TRACKERS
+    print(
+        f"\n{TRACKERS} trackers at {RATE:g} Hz for {elapsed:.1f} s:"
+        f" {samples} samples, {reps} reps,"
+        f" loop lag {loop_lag * 1000:.1f} ms,"
+        f" {handler_per_sample:.1f} us handler time per sample,"
+        f" {writes_per_second:.1f} writes/s per tracker"
+    )
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert samples >= TRACKERS * RATE * DURATION * 0.9
+    assert reps >= TRACKERS * (DURATION / REP_PERIOD - 1)
+    assert loop_lag * 1000 <= MAX_LOOP_LAG_MS
+    assert handler_per_sample <= MAX_HANDLER_US_PER_SAMPLE
+    assert writes_per_second <= MAX_WRITES_PER_SECOND
@@ -0,0 +1,91 @@
+"""Check that the vectorized NumPy paths of the engine match the scalar ones.
+
+Runs without Home Assistant:
+
+    pytest benchmarks/test_engine_paths.py
+"""
+
+import itertools
+import random
+
+import pytest
+
+from _component import load
+import traces
+
+np = pytest.importorskip("numpy")
+
+const = load("const")
+engine_module = load("engine")
+parameters_module = load("parameters")
+
+# (rise, hold, fall) seconds, including phases of zero length.
+PHASES = ((0, 0, 0), (0, 1, 1), (1, 0, 1), (1, 1, 0), (0, 0, 1), (0.5, 0.3, 0.7))
+
+
+def noisy_trace(seed: int):
+    """Return a synthetic workout with glitches and missing samples."""
+    timestamps, distances, _ = traces.synthetic(
+        duration=120, spike_rate=0.01, calibration=0, seed=seed
+    )
+    rng = random.Random(seed)
+    distances = [
+        float("nan") if rng.random() < 0.02 else distance for distance in distances
+    ]
+    return timestamps, distances
+
+
+@pytest.mark.parametrize(
+    ("filter_type", "adaptive", "seed"),
+    list(itertools.product(const.FILTER_TYPES, (False, True), range(3))),
+)
+def test_process_samples(filter_type: str, adaptive: bool, seed: int) -> None:
+    """Both paths find the same reps and end in the same state."""
+    timestamps, distances = noisy_trace(seed)
+    parameters = parameters_module.PushupParameters(
+        filter_type=filter_type, adaptive_thresholds=adaptive
+    )
+    engines = []
+    reps = []
+    for vectorized in (False, True):
+        engine = engine_module.PushupEngine(parameters)
+        engine.set_calibration(0.12, 0.42)
+        reps.append(engine.process_samples(timestamps, distances, vectorized))
+        engines.append(engine)
+
+    scalar, vectorized = engines
+    assert reps[0]
+    assert list(reps[1]) == reps[0]
+    assert vectorized.direction is scalar.direction
+    assert (vectorized.lower_threshold, vectorized.upper_threshold) == (
+        scalar.lower_threshold,
+        scalar.upper_threshold,
+    )
+    assert vectorized.analytics.as_dict() == scalar.analytics.as_dict()
+
+
+@pytest.mark.parametrize(
+    ("curve", "phases"), list(itertools.product(const.CURVE_TYPES, PHASES))
+)
+def test_envelope_output(curve: str, phases: tuple[float, float, float]) -> None:
+    """Both paths produce the same output, including at boost boundaries."""
+    rise_time, boost_time, fall_time = phases
+    parameters = parameters_module.PushupParameters(
+        rise_time=rise_time,
+        boost_time=boost_time,
+        fall_time=fall_time,
+        envelope_curve=curve,
+        custom_curve=(0, 0.3, 1) if curve == const.CURVE_CUSTOM else (),
+    )
+    engine = engine_module.PushupEngine(parameters)
+    rng = np.random.default_rng(len(curve))
+    # Reps and grid share a 0.1 s step so boosts start and end on grid times.
+    rep_times = np.sort(np.round(rng.uniform(0, 20, 40), 1))
+    grid = np.round(np.arange(0, 25, 0.1), 1)
+
+    scalar = engine.envelope_output(rep_times, grid, vectorized=False)
+    vectorized = engine.envelope_output(rep_times, grid, vectorized=True)
+    np.testing.assert_array_equal(vectorized, scalar)
+    if not rise_time:
+        # A boost without a rise shows its full value from its start.
+        assert scalar[np.searchsorted(grid, rep_times[0])] > 0
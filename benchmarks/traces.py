@@ -0,0 +1,88 @@
+"""Distance traces for the Pushup Tracker benchmarks.
+
+A trace is a ``(timestamps, distances, expected_reps)`` tuple. Timestamps are
+seconds, distances are metres and ``expected_reps`` is the ground-truth rep
+count, or None when unknown.
+"""
+
+import csv
+import math
+from pathlib import Path
+import random
+
+
+def synthetic(
+    duration: float = 600.0,
+    rate: float = 50.0,
+    period: float = 2.2,
+    bottom: float = 0.12,
+    top: float = 0.42,
+    noise: float = 0.005,
+    spike_rate: float = 0.0,
+    calibration: float = 10.0,
+    seed: int = 0,
+):
+    """Return a synthetic trace of steady reps preceded by a calibration phase.
+
+    The first ``calibration`` seconds sweep the full range once; after that
+    every ``period`` seconds is one rep whose depth and timing jitter a little.
+    ``spike_rate`` is the fraction of samples replaced by a random glitch.
+    """
+    rng = random.Random(seed)
+    step = 1 / rate
+    count = int(duration * rate)
+    timestamps = [index * step for index in range(count)]
+    distances = []
+    reps = 0
+    phase = 0.0
+    depth = 1.0
+    last_cycle = -1
+    for timestamp in timestamps:
+        if timestamp < calibration:
+            # One slow sweep from top to bottom and back.
+            position = 0.5 + 0.5 * math.cos(2 * math.pi * timestamp / calibration)
+            distance = bottom + (top - bottom) * position
+        else:
+            elapsed = timestamp - calibration
+            cycle = int(elapsed // period)
+            if cycle != last_cycle:
+                last_cycle = cycle
+                phase = rng.uniform(-0.05, 0.05)
+                depth = rng.uniform(0.9, 1.0)
+            position = 0.5 + 0.5 * math.cos(2 * math.pi * (elapsed / period + phase))
+            distance = top - (top - bottom) * depth * (1 - position)
+        distance += rng.gauss(0, noise)
+        if spike_rate and rng.random() < spike_rate:
+            distance = rng.uniform(0, 2 * top)
+        distances.append(distance)
+
+    # Each complete cycle after calibration reaches the bottom exactly once.
+    workout = duration - calibration
+    reps = int((workout - period / 2) // period) + 1 if workout >= period / 2 else 0
+    return timestamps, distances, reps
+
+
+def load(path: str, expected_reps: int | None = None):
+    """Load a recorded trace from a CSV or NPY file.
+
+    CSV files have ``timestamp,distance`` rows with an optional header. NPY
+    files hold an ``(N, 2)`` array of the same columns.
+    """
+    path = Path(path)
+    if path.suffix == ".npy":
+        import numpy as np
+
+        data = np.load(path)
+        return data[:, 0].tolist(), data[:, 1].tolist(), expected_reps
+
+    timestamps = []
+    distances = []
+    with path.open(newline="", encoding="utf-8") as file:
+        for row in csv.reader(file):
+            try:
+                timestamp, distance = float(row[0]), float(row[1])
+            except (IndexError, ValueError):
+                continue
+            timestamps.append(timestamp)
+            distances.append(distance)
+    return timestamps, distances, expected_reps
@@ -0,0 +1,70 @@
+"""Search tolerance and envelope settings for a labelled distance trace.
+
+Replays the trace with many parameter sets spread over every core and prints
+the best ones by rep count error, use of the output range and roughness.
+
+    python benchmarks/tune.py
+    python benchmarks/tune.py --trace recorded.csv --expected-reps 120 --method grid
+"""
+
+import argparse
+import sys
+import time
+
+from _component import load
+import traces
+
+tuning = load("tuning")
+parameters_module = load("parameters")
+const = load("const")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the search and print the best settings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trace", help="CSV, NPY or capture file; else synthetic")
+    parser.add_argument("--expected-reps", type=int, help="ground truth for --trace")
+    parser.add_argument("--duration", type=float, default=300.0)
+    parser.add_argument("--spike-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--calibration",
+        type=float,
+        default=10.0,
+        help="seconds at the start of the trace used for calibration",
+    )
+    parser.add_argument("--method", choices=("random", "grid"), default="random")
+    parser.add_argument("--samples", type=int, default=200, help="random candidates")
+    parser.add_argument("--workers", type=int, help="processes; default one per core")
+    parser.add_argument(
+        "--filter", choices=const.FILTER_TYPES, default=const.DEFAULT_FILTER_TYPE
+    )
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.trace and args.trace.endswith(".bin"):
+        timestamps, distances = tuning.load_trace(args.trace)
+        expected = args.expected_reps
+    elif args.trace:
+        timestamps, distances, expected = traces.load(args.trace, args.expected_reps)
+    else:
+        timestamps, distances, expected = traces.synthetic(
+            duration=args.duration,
+            spike_rate=args.spike_rate,
+            calibration=args.calibration,
+        )
+    if expected is None:
+        parser.error("--expected-reps is required with --trace")
+
+    trace = tuning.Trace(timestamps, distances, expected, args.calibration)
+    base = parameters_module.PushupParameters(filter_type=args.filter)
+    started = time.perf_counter()
+    results = tuning.tune(trace, base, args.method, args.samples, workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"{len(results)} candidates in {elapsed:.1f} s, {expected} reps expected")
+    for result in results[: args.top]:
+        print(result.as_dict())
+    return 0 if results and results[0].rep_error == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,27 +1,117 @@
 """The Pushup Tracker integration."""
 
+import asyncio
+from pathlib import Path
+import time
+
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .capture import CaptureFile
+from .const import (
+    CAPTURE_RECORDS,
+    CONF_CAPTURE,
+    CONF_CUSTOM_CURVE,
+    CONF_INPUT_ENTITIES,
+    CONF_INPUT_ENTITY,
+    DATA_COORDINATOR,
+    DOMAIN,
+)
+from .coordinator import PushupCoordinator
+from .curves import parse_points
+from .history import PushupHistory
+from .parameters import ParameterStore, PushupParameters
+from .restore import async_restore_entry
+from .services import async_setup_services
+from .stats import TrackerStats
+from .views import PushupCaptureView
+from .websocket_api import async_setup_websocket
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+PLATFORMS = [
+    Platform.BUTTON,
+    Platform.NUMBER,
+    Platform.SELECT,
+    Platform.SENSOR,
+    Platform.SWITCH,
+]
 
-from .const import CONF_INPUT_ENTITY, DOMAIN
 
-PLATFORMS = [Platform.BUTTON, Platform.NUMBER, Platform.SENSOR, Platform.SWITCH]
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Pushup Tracker services."""
+    async_setup_services(hass)
+    hass.http.register_view(PushupCaptureView)
+    async_setup_websocket(hass)
+    return True
+
+
+def _capture_path(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return the raw capture file of a config entry."""
+    return Path(hass.config.path(DOMAIN, f"capture.{entry_id}.bin"))
 
 
 async def async_setup_entry(hass: HomeAssistant, entry):
     """Set up Pushup Tracker from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    if DATA_COORDINATOR not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_COORDINATOR] = PushupCoordinator(hass.loop)
 
-    # Initialize state storage
+    started = time.perf_counter()
     entry_id = entry.entry_id
+    stats = TrackerStats()
+    history = PushupHistory(hass, entry_id)
+    capture = None
+    pending = [history.async_load()]
+    if entry.data.get(CONF_CAPTURE):
+        capture = CaptureFile(_capture_path(hass, entry_id), CAPTURE_RECORDS)
+        pending.append(hass.async_add_executor_job(capture.open))
+    await asyncio.gather(*pending)
+
+    # Restore every entity's saved value at once, before any entity is added.
+    values, calibration = async_restore_entry(hass, entry)
+    parameters = ParameterStore(
+        hass.loop,
+        PushupParameters(
+            custom_curve=(
+                parse_points(entry.data[CONF_CUSTOM_CURVE])
+                if entry.data.get(CONF_CUSTOM_CURVE)
+                else ()
+            )
+        ),
+    )
+    parameters.async_update(values)
+    stats.restore_time = time.perf_counter() - started
+
+    # Initialize state storage
     hass.data[DOMAIN][entry_id] = {
+        "analytics_callbacks": [],
         "calibrating": False,
-        "input_entity": entry.data[CONF_INPUT_ENTITY],
-        "number_update_callbacks": [],
+        "calibration": calibration,
+        "input_entities": entry.data[CONF_INPUT_ENTITIES],
+        "history": history,
+        "parameters": parameters,
+        "rep_callbacks": [history.async_add_rep],
+        "sensor_ready": hass.loop.create_future(),
+        "stats": stats,
     }
+    if capture is not None:
+        hass.data[DOMAIN][entry_id]["capture"] = capture
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    stats.setup_time = time.perf_counter() - started
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry) -> bool:
+    """Migrate an old config entry."""
+    if entry.version == 1:
+        data = dict(entry.data)
+        data[CONF_INPUT_ENTITIES] = [data.pop(CONF_INPUT_ENTITY)]
+        hass.config_entries.async_update_entry(entry, data=data, version=2)
     return True
 
 
@@ -29,6 +119,19 @@ async def async_unload_entry(hass: HomeAssistant, entry):
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["history"].async_save()
+        if capture := entry_data.get("capture"):
+            await hass.async_add_executor_job(capture.close)
+        if len(hass.data[DOMAIN]) == 1:
+            # Only the coordinator is left.
+            hass.data[DOMAIN].pop(DATA_COORDINATOR).async_stop()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry) -> None:
+    """Delete the stored history and capture of a removed config entry."""
+    await PushupHistory(hass, entry.entry_id).async_remove()
+    path = _capture_path(hass, entry.entry_id)
+    await hass.async_add_executor_job(path.unlink, True)
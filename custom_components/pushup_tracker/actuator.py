@@ -0,0 +1,107 @@
+"""Direct actuator binding for Pushup Tracker."""
+
+import logging
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .coalescer import WriteCoalescer
+
+_LOGGER = logging.getLogger(__name__)
+
+# Domain: (service, data key, whether the key takes a percentage)
+ACTUATOR_SERVICES = {
+    "light": ("turn_on", "brightness_pct", True),
+    "fan": ("set_percentage", "percentage", True),
+    "number": ("set_value", "value", False),
+    "input_number": ("set_value", "value", False),
+}
+
+
+class ActuatorBinding:
+    """Drive an entity from the sensor output without an automation.
+
+    Values closer than ``delta`` to the last one sent are skipped, except the
+    resting value 0. Calls are rate limited and only one is in flight at a
+    time; values arriving meanwhile replace each other, so a slow actuator
+    gets the latest value next instead of a backlog.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        service: str | None,
+        delta: float,
+        max_rate: float,
+    ) -> None:
+        """Initialize the binding."""
+        self._hass = hass
+        self.entity_id = entity_id
+        target_domain = entity_id.split(".", 1)[0]
+        if service:
+            self._domain, self._service = service.split(".", 1)
+            self._data_key, self._percent = "value", False
+        else:
+            self._domain = target_domain
+            self._service, self._data_key, self._percent = ACTUATOR_SERVICES[
+                target_domain
+            ]
+        self.delta = delta
+        self._coalescer = WriteCoalescer(hass, self._async_send, 1 / max_rate)
+        self._value = None
+        self._max_value = None
+        self._sent = None
+        self._in_flight = False
+        self.calls = 0
+        self.failures = 0
+
+    @callback
+    def async_update(self, value: float, max_value: float) -> None:
+        """Send ``value`` out of ``max_value`` if it moved far enough."""
+        self._value = value
+        self._max_value = max_value
+        sent = self._sent
+        if sent is not None and value != 0 and abs(value - sent) < self.delta:
+            # Drop a held change that is now too small to matter.
+            self._coalescer.async_cancel()
+            return
+        self._coalescer.async_request(value)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any held value."""
+        self._coalescer.async_cancel()
+
+    @callback
+    def _async_send(self) -> None:
+        """Start a call with the latest value unless one is still running."""
+        if self._in_flight:
+            # Let the same value be requested again once the call is done.
+            self._coalescer.async_invalidate()
+            return
+        value = self._value
+        if self._percent:
+            value = round(value / self._max_value * 100) if self._max_value else 0
+        self._sent = self._value
+        self._in_flight = True
+        self._hass.async_create_task(self._async_call(value))
+
+    async def _async_call(self, value: float) -> None:
+        """Call the service and catch up with values that came in meanwhile."""
+        self.calls += 1
+        try:
+            await self._hass.services.async_call(
+                self._domain,
+                self._service,
+                {ATTR_ENTITY_ID: self.entity_id, self._data_key: value},
+                blocking=True,
+            )
+        except HomeAssistantError as err:
+            self.failures += 1
+            _LOGGER.warning("Failed to update %s: %s", self.entity_id, err)
+        finally:
+            self._in_flight = False
+        if self._value != self._sent:
+            self.async_update(self._value, self._max_value)
@@ -0,0 +1,221 @@
+"""Streaming per-rep analytics for Pushup Tracker.
+
+Reps are measured from the detector's phases: the top phase lasts from
+reaching the upper threshold to reaching the lower one, the bottom phase the
+other way round. Only the extreme of the current phase is kept, so memory
+stays the same however long a set runs.
+"""
+
+from math import sqrt
+
+from .const import SESSION_GAP
+
+
+class RunningStats:
+    """Welford running mean and variance with the best value seen."""
+
+    __slots__ = ("count", "mean", "_m2", "best", "_higher_is_better")
+
+    def __init__(self, higher_is_better: bool = True) -> None:
+        """Initialize the statistics."""
+        self._higher_is_better = higher_is_better
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every value."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.best = None
+
+    def add(self, value: float) -> None:
+        """Add one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        best = self.best
+        if best is None or (value > best if self._higher_is_better else value < best):
+            self.best = value
+
+    @property
+    def std(self) -> float | None:
+        """Return the sample standard deviation."""
+        if self.count < 2:
+            return None
+        return sqrt(self._m2 / (self.count - 1))
+
+    def as_dict(self, digits: int) -> dict:
+        """Return the aggregates rounded to ``digits``."""
+        if not self.count:
+            return {}
+        std = self.std
+        return {
+            "mean": round(self.mean, digits),
+            "std": None if std is None else round(std, digits),
+            "best": round(self.best, digits),
+            "count": self.count,
+        }
+
+
+class RunningTrend:
+    """Least squares slope of values against their position, updated per value."""
+
+    __slots__ = ("count", "mean", "_mean_x", "_m2_x", "_c_xy")
+
+    def __init__(self) -> None:
+        """Initialize the trend."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every value."""
+        self.count = 0
+        self.mean = 0.0
+        self._mean_x = 0.0
+        self._m2_x = 0.0
+        self._c_xy = 0.0
+
+    def add(self, value: float) -> None:
+        """Add the next value."""
+        x = self.count
+        self.count += 1
+        dx = x - self._mean_x
+        self._mean_x += dx / self.count
+        self.mean += (value - self.mean) / self.count
+        self._m2_x += dx * (x - self._mean_x)
+        self._c_xy += dx * (value - self.mean)
+
+    @property
+    def slope(self) -> float | None:
+        """Return the change per value, or None with fewer than two values."""
+        if self.count < 2:
+            return None
+        return self._c_xy / self._m2_x
+
+
+class RepAnalytics:
+    """Depth, timing and cadence of each rep with session aggregates.
+
+    A rep is measured when the bottom phase ends: depth is the top peak minus
+    the bottom trough, the eccentric time runs from peak to trough and the
+    concentric time from the trough until the upper threshold is reached
+    again, so a rep is reported as soon as it is complete.
+    """
+
+    __slots__ = (
+        "_up",
+        "_peak",
+        "_peak_time",
+        "_trough",
+        "_trough_time",
+        "_last_complete",
+        "completed",
+        "peak",
+        "trough",
+        "depth",
+        "eccentric",
+        "concentric",
+        "duration",
+        "cadence",
+        "depth_stats",
+        "duration_stats",
+        "cadence_stats",
+        "fatigue",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the analytics."""
+        self.completed = 0
+        self.depth_stats = RunningStats()
+        self.duration_stats = RunningStats(higher_is_better=False)
+        self.cadence_stats = RunningStats()
+        self.fatigue = RunningTrend()
+        self.reset()
+        self.reset_session()
+
+    def reset(self) -> None:
+        """Forget the rep in progress, e.g. after recalibrating."""
+        self._up = False
+        self._peak = float("-inf")
+        self._peak_time = None
+        self._trough = float("inf")
+        self._trough_time = None
+
+    def reset_session(self) -> None:
+        """Forget the last rep and the session aggregates."""
+        self._last_complete = None
+        self.peak = None
+        self.trough = None
+        self.depth = None
+        self.eccentric = None
+        self.concentric = None
+        self.duration = None
+        self.cadence = None
+        self.depth_stats.reset()
+        self.duration_stats.reset()
+        self.cadence_stats.reset()
+        self.fatigue.reset()
+
+    def add(self, timestamp: float, distance: float, up: bool) -> bool:
+        """Add a sample and the phase after it; return True if a rep completed."""
+        if up is not self._up:
+            self._up = up
+            if up:
+                completed = self._peak_time is not None and self._complete(timestamp)
+                self._peak, self._peak_time = distance, timestamp
+                return completed
+            self._trough, self._trough_time = distance, timestamp
+            return False
+        if up:
+            if distance > self._peak:
+                self._peak, self._peak_time = distance, timestamp
+        elif distance < self._trough:
+            self._trough, self._trough_time = distance, timestamp
+        return False
+
+    def _complete(self, now: float) -> bool:
+        """Measure the rep that just ended."""
+        last = self._last_complete
+        if last is not None and now - last > SESSION_GAP:
+            self.reset_session()
+            last = None
+        self._last_complete = now
+        self.completed += 1
+
+        self.peak = self._peak
+        self.trough = self._trough
+        self.depth = self._peak - self._trough
+        self.eccentric = self._trough_time - self._peak_time
+        self.concentric = now - self._trough_time
+        self.duration = self.eccentric + self.concentric
+        self.cadence = 60 / (now - last) if last is not None and now > last else None
+
+        self.depth_stats.add(self.depth)
+        self.duration_stats.add(self.duration)
+        if self.cadence is not None:
+            self.cadence_stats.add(self.cadence)
+        self.fatigue.add(self.duration)
+        return True
+
+    @property
+    def fatigue_trend(self) -> float | None:
+        """Return how much longer each rep takes, in percent of the mean."""
+        slope = self.fatigue.slope
+        if slope is None or self.fatigue.mean <= 0:
+            return None
+        return slope / self.fatigue.mean * 100
+
+    def as_dict(self) -> dict:
+        """Return the last rep and the session aggregates."""
+        return {
+            "completed": self.completed,
+            "depth": self.depth,
+            "eccentric": self.eccentric,
+            "concentric": self.concentric,
+            "duration": self.duration,
+            "cadence": self.cadence,
+            "fatigue_trend": self.fatigue_trend,
+            "depth_stats": self.depth_stats.as_dict(4),
+            "duration_stats": self.duration_stats.as_dict(2),
+            "cadence_stats": self.cadence_stats.as_dict(1),
+        }
@@ -4,15 +4,7 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import (
-    DEFAULT_BOOST_TIME,
-    DEFAULT_BOOST_VALUE,
-    DEFAULT_FALL_TIME,
-    DEFAULT_MAX_VALUE,
-    DEFAULT_RISE_TIME,
-    DEFAULT_TOLERANCE,
-    DOMAIN,
-)
+from .const import DOMAIN
 
 
 async def async_setup_entry(
@@ -53,19 +45,5 @@ class ResetConfigurationButton(ButtonEntity):
 
     async def async_press(self):
         """Handle the button being pressed."""
-        default_values = {
-            "boost_time": DEFAULT_BOOST_TIME,
-            "boost_value": DEFAULT_BOOST_VALUE,
-            "fall_time": DEFAULT_FALL_TIME,
-            "rise_time": DEFAULT_RISE_TIME,
-            "tolerance": DEFAULT_TOLERANCE,
-            "max_value": DEFAULT_MAX_VALUE,
-        }
-
-        # Reset the configuration to default values
-        for key, value in default_values.items():
-            self.entry_data[key] = value
-
-        # Update state of number entities
-        for callback in self.entry_data["number_update_callbacks"]:
-            callback()
+        # One change, so the sensor and every entity update once
+        self.entry_data["parameters"].async_reset()
@@ -0,0 +1,215 @@
+"""Robust range calibration for Pushup Tracker."""
+
+from .const import (
+    ADAPTIVE_MAX_STEP,
+    ADAPTIVE_MIN_SHARE,
+    ADAPTIVE_WEIGHT,
+    CALIBRATION_HIGH_QUANTILE,
+    CALIBRATION_LOW_QUANTILE,
+    CALIBRATION_MIN_RANGE,
+    CALIBRATION_MIN_SAMPLES,
+)
+
+
+class P2Quantile:
+    """Streaming quantile estimate with the P-square algorithm.
+
+    Five markers track the minimum, the target quantile, the maximum and the
+    two halfway quantiles between them. Each sample moves the markers in
+    constant time and memory, however many samples are seen.
+    """
+
+    __slots__ = ("quantile", "count", "_heights", "_positions", "_desired", "_steps")
+
+    def __init__(self, quantile: float) -> None:
+        """Initialize the estimator."""
+        self.quantile = quantile
+        self.count = 0
+        self._heights = [0.0] * 5
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4]
+        self._steps = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, sample: float) -> None:
+        """Add one sample."""
+        heights = self._heights
+        if self.count < 5:
+            heights[self.count] = sample
+            self.count += 1
+            if self.count == 5:
+                heights.sort()
+            return
+        self.count += 1
+
+        if sample < heights[0]:
+            heights[0] = sample
+            cell = 0
+        elif sample >= heights[4]:
+            heights[4] = sample
+            cell = 3
+        else:
+            cell = 0
+            while sample >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        desired = self._desired
+        steps = self._steps
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            desired[index] += steps[index]
+
+        for index in (1, 2, 3):
+            offset = desired[index] - positions[index]
+            if (offset >= 1 and positions[index + 1] - positions[index] > 1) or (
+                offset <= -1 and positions[index - 1] - positions[index] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(index, step)
+                if not heights[index - 1] < height < heights[index + 1]:
+                    height = heights[index] + step * (
+                        heights[index + step] - heights[index]
+                    ) / (positions[index + step] - positions[index])
+                heights[index] = height
+                positions[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        """Return the piecewise-parabolic prediction for moving a marker."""
+        heights = self._heights
+        positions = self._positions
+        below = positions[index] - positions[index - 1]
+        above = positions[index + 1] - positions[index]
+        return heights[index] + step / (positions[index + 1] - positions[index - 1]) * (
+            (below + step) * (heights[index + 1] - heights[index]) / above
+            + (above - step) * (heights[index] - heights[index - 1]) / below
+        )
+
+    @property
+    def value(self) -> float | None:
+        """Return the current quantile estimate."""
+        if self.count >= 5:
+            return self._heights[2]
+        if not self.count:
+            return None
+        ordered = sorted(self._heights[: self.count])
+        return ordered[round(self.quantile * (self.count - 1))]
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the smallest sample seen."""
+        if not self.count:
+            return None
+        return self._heights[0] if self.count >= 5 else min(self._heights[: self.count])
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the largest sample seen."""
+        if not self.count:
+            return None
+        return self._heights[4] if self.count >= 5 else max(self._heights[: self.count])
+
+
+class RangeCalibrator:
+    """Bottom and top of the movement range from low and high quantiles.
+
+    Quantiles ignore the occasional glitch that would stretch a raw min/max.
+    ``quality`` is 0 to 1: how settled the quantile range is, scaled down
+    until enough samples have been seen and 0 when the range is too small to
+    detect anything. The range counts as settled when its ends moved little,
+    relative to its size, over about the last ``CALIBRATION_MIN_SAMPLES``
+    samples.
+    """
+
+    __slots__ = ("_low", "_high", "_range", "_drift")
+
+    def __init__(self) -> None:
+        """Initialize the calibrator."""
+        self._low = P2Quantile(CALIBRATION_LOW_QUANTILE)
+        self._high = P2Quantile(CALIBRATION_HIGH_QUANTILE)
+        self._range = None
+        self._drift = 0.0
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.__init__()
+
+    def add(self, distance: float) -> None:
+        """Add one calibration sample."""
+        self._low.add(distance)
+        self._high.add(distance)
+        low = self._low.value
+        high = self._high.value
+        if self._range is not None:
+            # Running average of how far the ends move per sample.
+            moved = abs(low - self._range[0]) + abs(high - self._range[1])
+            self._drift += (moved - self._drift) / CALIBRATION_MIN_SAMPLES
+        self._range = (low, high)
+
+    @property
+    def count(self) -> int:
+        """Return the number of samples seen."""
+        return self._low.count
+
+    @property
+    def low(self) -> float | None:
+        """Return the bottom of the range."""
+        return self._low.value
+
+    @property
+    def high(self) -> float | None:
+        """Return the top of the range."""
+        return self._high.value
+
+    @property
+    def quality(self) -> float:
+        """Return the calibration quality between 0 and 1."""
+        low = self.low
+        high = self.high
+        if low is None or high - low < CALIBRATION_MIN_RANGE:
+            return 0.0
+        confidence = min(1.0, self.count / CALIBRATION_MIN_SAMPLES)
+        movement = self._drift * CALIBRATION_MIN_SAMPLES / (high - low)
+        return round(confidence * max(0.0, 1.0 - movement), 2)
+
+
+class AdaptiveRange:
+    """Bottom and top of the movement range following completed reps.
+
+    Each end is an exponentially weighted average of the rep troughs or
+    peaks, seeded with the calibrated range. One rep moves an end by at most
+    ``ADAPTIVE_MAX_STEP`` of the current range, and an update that would
+    shrink the range below ``ADAPTIVE_MIN_SHARE`` of the calibrated one is
+    ignored, so a single odd rep cannot collapse the thresholds.
+    """
+
+    __slots__ = ("low", "high", "updates", "_min_range")
+
+    def __init__(self) -> None:
+        """Initialize the range."""
+        self.seed(None, None)
+
+    def seed(self, low: float | None, high: float | None) -> None:
+        """Start over from a calibrated range."""
+        self.low = low
+        self.high = high
+        self.updates = 0
+        self._min_range = (
+            None if low is None or high is None else ADAPTIVE_MIN_SHARE * (high - low)
+        )
+
+    def add(self, trough: float, peak: float) -> bool:
+        """Follow one completed rep; return True if the range moved."""
+        if self._min_range is None:
+            return False
+        low = self.low
+        high = self.high
+        limit = ADAPTIVE_MAX_STEP * (high - low)
+        low += max(-limit, min(limit, ADAPTIVE_WEIGHT * (trough - low)))
+        high += max(-limit, min(limit, ADAPTIVE_WEIGHT * (peak - high)))
+        if high - low < self._min_range or (low, high) == (self.low, self.high):
+            return False
+        self.low = low
+        self.high = high
+        self.updates += 1
+        return True
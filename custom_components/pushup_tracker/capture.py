@@ -0,0 +1,138 @@
+"""Raw sample capture to a memory-mapped ring file for Pushup Tracker.
+
+The file is a 32 byte header followed by a fixed number of 16 byte records.
+Every input sample is recorded as it arrives, before several sources are
+fused, with the index of the input entity it came from. Records are packed
+straight into the mapping, so capturing a sample costs no system call; the
+kernel writes dirty pages back on its own. The header holds how many records
+were ever written, which tells a reader where the ring starts, and the offset
+from the monotonic clock to Unix time.
+"""
+
+from collections.abc import Iterator
+import mmap
+import os
+from pathlib import Path
+import struct
+import time
+
+MAGIC = b"PUSHCAP1"
+VERSION = 2
+# Version 1 records left the source byte zero.
+READ_VERSIONS = (1, VERSION)
+# magic, version, record size, capacity, records written, Unix - monotonic ns
+HEADER = struct.Struct("<8sHHIqq")
+# monotonic ns, distance, direction (1 up, -1 down), rep flag, source, padding
+RECORD = struct.Struct("<qfbBBx")
+# records written, updated after every record
+COUNT = struct.Struct("<q")
+_COUNT_OFFSET = 16
+
+
+class CaptureFile:
+    """Fixed-size ring of raw samples in a memory-mapped file."""
+
+    __slots__ = ("path", "capacity", "count", "_file", "_map")
+
+    def __init__(self, path: Path, capacity: int) -> None:
+        """Initialize the capture; ``open`` does the blocking work."""
+        self.path = path
+        self.capacity = capacity
+        self.count = 0
+        self._file = None
+        self._map = None
+
+    def open(self) -> None:
+        """Create or reopen the file and map it. Blocking."""
+        size = HEADER.size + self.capacity * RECORD.size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Kept open for as long as the mapping exists.
+        self._file = open(self.path, "a+b")  # noqa: SIM115
+        existing = os.fstat(self._file.fileno()).st_size
+        if existing != size:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        magic, version, record_size, capacity, count, _ = HEADER.unpack_from(self._map)
+        self.count = 0
+        if (magic, version, record_size, capacity) == (
+            MAGIC,
+            VERSION,
+            RECORD.size,
+            self.capacity,
+        ) and count:
+            last = RECORD.unpack_from(
+                self._map, HEADER.size + ((count - 1) % capacity) * RECORD.size
+            )[0]
+            # Monotonic time restarts with the host; older records would get
+            # wrong Unix times, so a reboot starts a fresh ring.
+            if last <= time.monotonic_ns():
+                self.count = count
+        HEADER.pack_into(
+            self._map,
+            0,
+            MAGIC,
+            VERSION,
+            RECORD.size,
+            self.capacity,
+            self.count,
+            time.time_ns() - time.monotonic_ns(),
+        )
+
+    def close(self) -> None:
+        """Flush and unmap the file. Blocking."""
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def append(
+        self, monotonic_ns: int, distance: float, up: bool, rep: bool, source: int = 0
+    ) -> None:
+        """Pack one record into the ring."""
+        count = self.count
+        RECORD.pack_into(
+            self._map,
+            HEADER.size + (count % self.capacity) * RECORD.size,
+            monotonic_ns,
+            distance,
+            1 if up else -1,
+            rep,
+            source,
+        )
+        self.count = count + 1
+        COUNT.pack_into(self._map, _COUNT_OFFSET, count + 1)
+
+    def snapshot(self) -> bytes:
+        """Return a copy of the whole file."""
+        return self._map[:]
+
+
+def read_records(data: bytes) -> Iterator[tuple[int, float, int, bool, int]]:
+    """Yield ``(unix_ns, distance, direction, rep, source)`` records, oldest first."""
+    magic, version, record_size, capacity, count, offset = HEADER.unpack_from(data)
+    if magic != MAGIC or version not in READ_VERSIONS or record_size != RECORD.size:
+        raise ValueError("Not a Pushup Tracker capture file")
+    first = max(count - capacity, 0)
+    for index in range(first, count):
+        monotonic_ns, distance, direction, rep, source = RECORD.unpack_from(
+            data, HEADER.size + (index % capacity) * RECORD.size
+        )
+        yield monotonic_ns + offset, distance, direction, bool(rep), source
+
+
+def read_file(path: str | Path) -> list[tuple[int, float, int, bool, int]]:
+    """Return every record of a capture file, oldest first."""
+    return list(read_records(Path(path).read_bytes()))
+
+
+def to_csv(data: bytes) -> str:
+    """Return the records of a capture as CSV with Unix seconds."""
+    lines = ["timestamp,distance,direction,rep,source"]
+    lines.extend(
+        f"{unix_ns / 1e9:.6f},{distance:.6g},{direction},{int(rep)},{source}"
+        for unix_ns, distance, direction, rep, source in read_records(data)
+    )
+    return "\n".join(lines) + "\n"
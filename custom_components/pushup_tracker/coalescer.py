@@ -0,0 +1,83 @@
+"""State write coalescing for Pushup Tracker."""
+
+from collections.abc import Callable, Hashable
+from datetime import datetime
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_NOTHING = object()
+
+
+class WriteCoalescer:
+    """Publish only changed values, at most once per ``min_interval`` seconds.
+
+    Callers pass a hashable key describing what would be published. Unchanged
+    keys are dropped. A change that arrives too soon after the previous
+    publish is held and flushed once the interval has passed, so the last
+    value is always written even if nothing else happens afterwards.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, publish: Callable[[], None], min_interval: float
+    ) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._publish = publish
+        self.min_interval = min_interval
+        self._published_key = None
+        self._published_at = float("-inf")
+        self._pending = _NOTHING
+        self._unsub_flush = None
+
+    @callback
+    def async_request(self, key: Hashable) -> None:
+        """Publish if ``key`` differs from the last published key."""
+        if key == self._published_key:
+            # Back to what is already published; nothing left to flush.
+            self._pending = _NOTHING
+            return
+        wait = self._published_at + self.min_interval - time.monotonic()
+        if wait <= 0:
+            self._async_publish(key)
+            return
+        self._pending = key
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self._hass, wait, self._async_flush)
+
+    @callback
+    def async_publish_now(self, key: Hashable) -> None:
+        """Publish immediately, ignoring the rate limit."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._async_publish(key)
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Forget the published key so the next request always publishes."""
+        self._published_key = None
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any held change and cancel the flush timer."""
+        self._pending = _NOTHING
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Publish the held change."""
+        self._unsub_flush = None
+        if self._pending is not _NOTHING:
+            self._async_publish(self._pending)
+
+    @callback
+    def _async_publish(self, key: Hashable) -> None:
+        """Publish now and remember what was published."""
+        self._pending = _NOTHING
+        self._published_key = key
+        self._published_at = time.monotonic()
+        self._publish()
@@ -5,15 +5,39 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
-from homeassistant.helpers import selector
-
-from .const import CONF_INPUT_ENTITY, DOMAIN
+from homeassistant.helpers import config_validation as cv, selector
+
+from .const import (
+    ACTUATOR_DOMAINS,
+    CONF_ACTUATOR_DELTA,
+    CONF_ACTUATOR_ENTITY,
+    CONF_ACTUATOR_MAX_RATE,
+    CONF_ACTUATOR_SERVICE,
+    CONF_CAPTURE,
+    CONF_CUSTOM_CURVE,
+    CONF_FUSION_METHOD,
+    CONF_FUSION_WEIGHTS,
+    CONF_INPUT_ENTITIES,
+    DEFAULT_ACTUATOR_DELTA,
+    DEFAULT_ACTUATOR_MAX_RATE,
+    DEFAULT_FUSION_METHOD,
+    DOMAIN,
+    FUSION_METHODS,
+)
+from .curves import parse_points
+from .fusion import parse_weights
+
+INPUT_ENTITIES_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain=["sensor", "number", "input_number"], multiple=True
+    ),
+)
 
 
 class PushupTrackerConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Pushup Tracker."""
 
-    VERSION = 1
+    VERSION = 2
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
@@ -26,6 +50,8 @@ class PushupTrackerConfigFlow(ConfigFlow, domain=DOMAIN):
                 if entry.data.get(CONF_NAME) == user_input[CONF_NAME]:
                     errors[CONF_NAME] = "already_configured"
                     break
+            if not user_input[CONF_INPUT_ENTITIES]:
+                errors[CONF_INPUT_ENTITIES] = "no_input_entities"
 
             if not errors:
                 return self.async_create_entry(
@@ -37,11 +63,7 @@ class PushupTrackerConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_NAME): str,
-                    vol.Required(CONF_INPUT_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain=["sensor", "number", "input_number"]
-                        ),
-                    ),
+                    vol.Required(CONF_INPUT_ENTITIES): INPUT_ENTITIES_SELECTOR,
                 }
             ),
             errors=errors,
@@ -63,30 +85,122 @@ class PushupTrackerOptionsFlow(OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
+        errors = {}
+
         if user_input is not None:
-            self.hass.config_entries.async_update_entry(
-                self.config_entry,
-                data={
-                    **self.config_entry.data,
-                    CONF_INPUT_ENTITY: user_input[CONF_INPUT_ENTITY],
-                },
-            )
-            # Trigger reload to apply changes
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-            return self.async_create_entry(title="", data={})
+            custom_curve = user_input.get(CONF_CUSTOM_CURVE, "").strip()
+            if custom_curve:
+                try:
+                    parse_points(custom_curve)
+                except ValueError:
+                    errors[CONF_CUSTOM_CURVE] = "invalid_curve"
+            input_entities = user_input[CONF_INPUT_ENTITIES]
+            if not input_entities:
+                errors[CONF_INPUT_ENTITIES] = "no_input_entities"
+            weights = user_input.get(CONF_FUSION_WEIGHTS, "").strip()
+            try:
+                parse_weights(weights, len(input_entities))
+            except ValueError:
+                errors[CONF_FUSION_WEIGHTS] = "invalid_weights"
+            actuator_service = user_input.get(CONF_ACTUATOR_SERVICE, "").strip()
+            if actuator_service:
+                try:
+                    cv.service(actuator_service)
+                except vol.Invalid:
+                    errors[CONF_ACTUATOR_SERVICE] = "invalid_service"
+
+            if not errors:
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    data={
+                        **self.config_entry.data,
+                        CONF_INPUT_ENTITIES: input_entities,
+                        CONF_FUSION_METHOD: user_input[CONF_FUSION_METHOD],
+                        CONF_FUSION_WEIGHTS: weights,
+                        CONF_CUSTOM_CURVE: custom_curve,
+                        CONF_ACTUATOR_ENTITY: user_input.get(CONF_ACTUATOR_ENTITY),
+                        CONF_ACTUATOR_SERVICE: actuator_service,
+                        CONF_ACTUATOR_DELTA: user_input[CONF_ACTUATOR_DELTA],
+                        CONF_ACTUATOR_MAX_RATE: user_input[CONF_ACTUATOR_MAX_RATE],
+                        CONF_CAPTURE: user_input[CONF_CAPTURE],
+                    },
+                )
+                # Trigger reload to apply changes
+                await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+                return self.async_create_entry(title="", data={})
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Required(
-                        CONF_INPUT_ENTITY,
-                        default=self.config_entry.data.get(CONF_INPUT_ENTITY),
+                        CONF_INPUT_ENTITIES,
+                        default=self.config_entry.data.get(CONF_INPUT_ENTITIES),
+                    ): INPUT_ENTITIES_SELECTOR,
+                    vol.Required(
+                        CONF_FUSION_METHOD,
+                        default=self.config_entry.data.get(
+                            CONF_FUSION_METHOD, DEFAULT_FUSION_METHOD
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=FUSION_METHODS,
+                            translation_key=CONF_FUSION_METHOD,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_FUSION_WEIGHTS,
+                        default=self.config_entry.data.get(CONF_FUSION_WEIGHTS, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_CUSTOM_CURVE,
+                        default=self.config_entry.data.get(CONF_CUSTOM_CURVE, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_ACTUATOR_ENTITY,
+                        description={
+                            "suggested_value": self.config_entry.data.get(
+                                CONF_ACTUATOR_ENTITY
+                            )
+                        },
                     ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain=["sensor", "number", "input_number"]
+                        selector.EntitySelectorConfig(domain=ACTUATOR_DOMAINS),
+                    ),
+                    vol.Optional(
+                        CONF_ACTUATOR_SERVICE,
+                        default=self.config_entry.data.get(CONF_ACTUATOR_SERVICE, ""),
+                    ): str,
+                    vol.Required(
+                        CONF_ACTUATOR_DELTA,
+                        default=self.config_entry.data.get(
+                            CONF_ACTUATOR_DELTA, DEFAULT_ACTUATOR_DELTA
                         ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=100,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
                     ),
+                    vol.Required(
+                        CONF_ACTUATOR_MAX_RATE,
+                        default=self.config_entry.data.get(
+                            CONF_ACTUATOR_MAX_RATE, DEFAULT_ACTUATOR_MAX_RATE
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0.1,
+                            max=10,
+                            step=0.1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_CAPTURE,
+                        default=self.config_entry.data.get(CONF_CAPTURE, False),
+                    ): bool,
                 }
             ),
+            errors=errors,
         )
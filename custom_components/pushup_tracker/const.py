@@ -6,13 +6,39 @@ MANUFACTURER = "Antek"
 MODEL = "Pushup Tracker"
 SW_VERSION = "1.0"
 
-CONF_INPUT_ENTITY = "input_entity"
+CONF_INPUT_ENTITY = "input_entity"  # single source of version 1 entries
+CONF_INPUT_ENTITIES = "input_entities"
+CONF_CUSTOM_CURVE = "custom_curve"
+CONF_FUSION_METHOD = "fusion_method"
+CONF_FUSION_WEIGHTS = "fusion_weights"
+CONF_ACTUATOR_ENTITY = "actuator_entity"
+CONF_ACTUATOR_SERVICE = "actuator_service"
+CONF_ACTUATOR_DELTA = "actuator_delta"
+CONF_ACTUATOR_MAX_RATE = "actuator_max_rate"
+CONF_CAPTURE = "capture"
+
+DATA_COORDINATOR = "coordinator"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_SAMPLES = "samples"
+
+ATTR_TRACE = "trace"
+ATTR_EXPECTED_REPS = "expected_reps"
+ATTR_CALIBRATION_TIME = "calibration_time"
+ATTR_METHOD = "method"
+ATTR_CANDIDATES = "candidates"
+ATTR_APPLY = "apply"
+
+SERVICE_INGEST_SAMPLES = "ingest_samples"
+SERVICE_TUNE = "tune"
 
 ATTR_MIN_DISTANCE = "min_distance"
 ATTR_MAX_DISTANCE = "max_distance"
 ATTR_DIRECTION = "direction"
 ATTR_TOLERANCE = "tolerance"
 ATTR_CALIBRATING = "calibrating"
+ATTR_CALIBRATION_QUALITY = "calibration_quality"
+ATTR_LAST_REP = "last_rep"
 
 DEFAULT_MAX_VALUE = 30
 DEFAULT_TOLERANCE = 15
@@ -21,5 +47,69 @@ DEFAULT_RISE_TIME = 1.0
 DEFAULT_BOOST_TIME = 0.8
 DEFAULT_FALL_TIME = 1.5
 DEFAULT_BOOST_VALUE = 70
+DEFAULT_MAX_UPDATE_RATE = 10
+DEFAULT_IMMEDIATE_OUTPUT = False
+DEFAULT_ADAPTIVE_THRESHOLDS = False
+
+FILTER_NONE = "none"
+FILTER_MEDIAN = "median"
+FILTER_EMA = "ema"
+FILTER_OUTLIER = "outlier"
+FILTER_TYPES = [FILTER_NONE, FILTER_MEDIAN, FILTER_EMA, FILTER_OUTLIER]
+
+CURVE_LINEAR = "linear"
+CURVE_EASE_IN_OUT = "ease_in_out"
+CURVE_EXPONENTIAL = "exponential"
+CURVE_CUSTOM = "custom"
+CURVE_TYPES = [CURVE_LINEAR, CURVE_EASE_IN_OUT, CURVE_EXPONENTIAL, CURVE_CUSTOM]
+
+DEFAULT_ENVELOPE_CURVE = CURVE_LINEAR
+CURVE_TABLE_SIZE = 256  # lookup table points across one whole boost
+CURVE_EXPONENT = 5.0  # steepness of the exponential curve
+
+DEFAULT_FILTER_TYPE = FILTER_NONE
+DEFAULT_FILTER_WINDOW = 5
+MAX_FILTER_WINDOW = 15
+OUTLIER_THRESHOLD = 3.0  # typical deviations before a sample is an outlier
+OUTLIER_MIN_DEVIATION = 0.01  # metres always accepted as ordinary noise
 
 MAX_DISTANCE = 0.5
+
+CALIBRATION_LOW_QUANTILE = 0.05
+CALIBRATION_HIGH_QUANTILE = 0.95
+CALIBRATION_MIN_SAMPLES = 50  # samples before calibration quality can reach 1
+CALIBRATION_MIN_RANGE = 0.02  # metres between bottom and top for a usable range
+
+ADAPTIVE_WEIGHT = 0.2  # weight of the newest rep in the adaptive range
+ADAPTIVE_MAX_STEP = 0.1  # share of the range one rep may move either end
+ADAPTIVE_MIN_SHARE = 0.5  # share of the calibrated range the adaptive one keeps
+
+FUSION_MEDIAN = "median"
+FUSION_WEIGHTED = "weighted"
+FUSION_METHODS = [FUSION_MEDIAN, FUSION_WEIGHTED]
+DEFAULT_FUSION_METHOD = FUSION_MEDIAN
+FUSION_MAX_AGE = 0.5  # seconds a source's last sample still counts
+
+ACTUATOR_DOMAINS = ["light", "fan", "number", "input_number"]
+DEFAULT_ACTUATOR_DELTA = 1  # output steps before the actuator is updated
+DEFAULT_ACTUATOR_MAX_RATE = 2  # actuator calls per second
+
+CAPTURE_RECORDS = 1 << 20  # 16 MiB, about 5.8 hours at 50 samples/s
+
+TUNING_METHODS = ["random", "grid"]
+DEFAULT_TUNING_CANDIDATES = 200
+TUNING_RESULTS = 5  # best parameter sets returned by the tune service
+
+DEFAULT_STREAM_RATE = 10  # websocket frames per second
+MAX_STREAM_RATE = 30
+MAX_STREAM_REPS = 32  # reps carried by one frame
+
+SENSOR_READY_TIMEOUT = 30  # seconds other platforms wait for the sensor
+
+MAX_ACTIVE_BOOSTS = 32
+LATENCY_WINDOW = 100  # reps kept for the rolling output latency percentiles
+UPDATE_INTERVAL = 0.1  # seconds between updates while an envelope is ramping
+
+HISTORY_SAVE_DELAY = 60  # seconds to batch rep log writes
+HISTORY_RETENTION_DAYS = 365
+SESSION_GAP = 300  # seconds between reps that start a new session
@@ -0,0 +1,106 @@
+"""Shared update clock for Pushup Tracker."""
+
+import asyncio
+import logging
+from math import ceil
+import time
+from typing import Protocol
+
+from .const import UPDATE_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+TICK_SLACK = 0.001  # seconds a tracker may be early and still run this tick
+
+
+class Tracker(Protocol):
+    """Something the coordinator can advance."""
+
+    def async_tick(self, now: float) -> float | None:
+        """Advance to ``now`` and return seconds until the next tick, or None."""
+
+
+class PushupCoordinator:
+    """One timer that advances every active tracker in a single pass.
+
+    Due times are rounded up to a shared grid of ``interval`` seconds, so
+    trackers that are ramping at the same time run in the same tick. Idle
+    trackers are not in the schedule at all, and with no active trackers the
+    coordinator holds no timer.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, interval: float = UPDATE_INTERVAL
+    ) -> None:
+        """Initialize the coordinator."""
+        self._loop = loop
+        self.interval = interval
+        self._due: dict[Tracker, float] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._armed_for = float("inf")
+        self.ticks = 0
+
+    def __len__(self) -> int:
+        """Return the number of active trackers."""
+        return len(self._due)
+
+    def async_schedule(self, tracker: Tracker, delay: float | None) -> None:
+        """Tick ``tracker`` after ``delay`` seconds, or stop ticking it if None."""
+        if delay is None:
+            self._due.pop(tracker, None)
+            return
+        now = time.monotonic()
+        due = self._align(now + delay)
+        self._due[tracker] = due
+        self._arm(due, now)
+
+    def _align(self, when: float) -> float:
+        """Round a time up to the shared tick grid."""
+        return ceil(when / self.interval - TICK_SLACK) * self.interval
+
+    def _arm(self, due: float, now: float) -> None:
+        """Make sure the timer fires no later than ``due``."""
+        if self._handle is not None:
+            if self._armed_for <= due:
+                return
+            self._handle.cancel()
+        self._armed_for = due
+        self._handle = self._loop.call_later(max(due - now, 0), self._tick)
+
+    def _tick(self) -> None:
+        """Advance every tracker that is due and re-arm for the next one."""
+        self._handle = None
+        self._armed_for = float("inf")
+        self.ticks += 1
+        now = time.monotonic()
+        deadline = now + TICK_SLACK
+        due_times = self._due
+        next_due = float("inf")
+        for tracker, due in list(due_times.items()):
+            if tracker not in due_times:
+                # Stopped by a tracker that ran earlier in this tick.
+                continue
+            if due > deadline:
+                next_due = min(next_due, due)
+                continue
+            try:
+                delay = tracker.async_tick(now)
+            except Exception:
+                _LOGGER.exception("Error updating %s", tracker)
+                delay = None
+            if delay is None:
+                due_times.pop(tracker, None)
+                continue
+            due = self._align(now + delay)
+            due_times[tracker] = due
+            next_due = min(next_due, due)
+        if next_due != float("inf"):
+            self._arm(next_due, now)
+
+    def async_stop(self) -> None:
+        """Stop ticking all trackers."""
+        self._due.clear()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._armed_for = float("inf")
@@ -0,0 +1,81 @@
+"""Boost envelope curves for Pushup Tracker."""
+
+from array import array
+from math import cos, exp, pi
+
+from .const import (
+    CURVE_CUSTOM,
+    CURVE_EASE_IN_OUT,
+    CURVE_EXPONENT,
+    CURVE_EXPONENTIAL,
+    CURVE_TABLE_SIZE,
+)
+
+
+def parse_points(text: str) -> tuple[float, ...]:
+    """Parse comma separated rise curve points between 0 and 1.
+
+    The points are evenly spaced over the rise phase and must start at 0 and
+    end at 1; the fall phase plays them back in reverse.
+    """
+    points = tuple(float(point) for point in text.split(",") if point.strip())
+    if len(points) < 2 or points[0] != 0 or points[-1] != 1:
+        raise ValueError("Curve points must start at 0 and end at 1")
+    if any(not 0 <= point <= 1 for point in points):
+        raise ValueError("Curve points must be between 0 and 1")
+    return points
+
+
+def _interpolate(points: tuple[float, ...], position: float) -> float:
+    """Return the value of evenly spaced points at a position in [0, 1]."""
+    scaled = position * (len(points) - 1)
+    index = min(int(scaled), len(points) - 2)
+    return points[index] + (scaled - index) * (points[index + 1] - points[index])
+
+
+def rise_shape(curve: str, position: float, points: tuple[float, ...]) -> float:
+    """Return the rise curve from 0 to 1 at a position in [0, 1]."""
+    if curve == CURVE_EASE_IN_OUT:
+        return (1 - cos(pi * position)) / 2
+    if curve == CURVE_EXPONENTIAL:
+        return (1 - exp(-CURVE_EXPONENT * position)) / (1 - exp(-CURVE_EXPONENT))
+    if curve == CURVE_CUSTOM and points:
+        return _interpolate(points, position)
+    return position
+
+
+def fall_shape(curve: str, position: float, points: tuple[float, ...]) -> float:
+    """Return the fall curve from 1 to 0 at a position in [0, 1]."""
+    if curve == CURVE_EXPONENTIAL:
+        # Exponential decay, shifted so it reaches 0 at the end of the fall.
+        floor = exp(-CURVE_EXPONENT)
+        return (exp(-CURVE_EXPONENT * position) - floor) / (1 - floor)
+    return rise_shape(curve, 1 - position, points)
+
+
+def build_table(
+    curve: str,
+    points: tuple[float, ...],
+    rise_time: float,
+    boost_time: float,
+    fall_time: float,
+    boost_value: float,
+) -> array:
+    """Sample one whole boost into ``CURVE_TABLE_SIZE + 1`` evenly spaced points.
+
+    Entry ``i`` is the boost value at ``i / CURVE_TABLE_SIZE`` of the boost
+    duration; the last entry is always 0.
+    """
+    duration = rise_time + boost_time + fall_time
+    table = array("d", bytes(8 * (CURVE_TABLE_SIZE + 1)))
+    hold_end = rise_time + boost_time
+    for index in range(CURVE_TABLE_SIZE):
+        elapsed = duration * index / CURVE_TABLE_SIZE
+        if elapsed <= rise_time:
+            shape = rise_shape(curve, elapsed / rise_time, points) if rise_time else 1
+        elif elapsed <= hold_end:
+            shape = 1
+        else:
+            shape = fall_shape(curve, (elapsed - hold_end) / fall_time, points)
+        table[index] = boost_value * shape
+    return table
@@ -0,0 +1,59 @@
+"""Diagnostics support for Pushup Tracker."""
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_COORDINATOR, DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    diagnostics = {
+        "entry": {"title": entry.title, "data": dict(entry.data)},
+        "stats": entry_data["stats"].as_dict(),
+        "active_trackers": len(hass.data[DOMAIN][DATA_COORDINATOR]),
+        "parameters_version": entry_data["parameters"].version,
+    }
+
+    if sensor := entry_data.get("sensor"):
+        engine = sensor.engine
+        diagnostics["engine"] = {
+            "parameters": asdict(engine.parameters),
+            "calibrating": engine.calibrating,
+            "min_distance": engine.min_distance,
+            "max_distance": engine.max_distance,
+            "calibration_quality": engine.calibration_quality,
+            "lower_threshold": engine.lower_threshold,
+            "upper_threshold": engine.upper_threshold,
+            "adaptive_range": [engine.adaptive.low, engine.adaptive.high],
+            "adaptive_updates": engine.adaptive.updates,
+            "direction": engine.direction.value,
+            "active_boosts": len(engine.envelope),
+            "dropped_boosts": engine.envelope.dropped,
+            "analytics": engine.analytics.as_dict(),
+        }
+        if actuator := sensor.actuator:
+            diagnostics["actuator"] = {
+                "entity_id": actuator.entity_id,
+                "calls": actuator.calls,
+                "failures": actuator.failures,
+            }
+
+    if capture := entry_data.get("capture"):
+        diagnostics["capture"] = {
+            "records": min(capture.count, capture.capacity),
+            "written": capture.count,
+        }
+
+    history = entry_data["history"]
+    diagnostics["history"] = {
+        "sessions": len(history.sessions),
+        "reps": history.total_reps,
+    }
+    return diagnostics
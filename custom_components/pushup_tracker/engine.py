@@ -0,0 +1,319 @@
+"""Home Assistant independent detection core for Pushup Tracker.
+
+The engine holds the calibrated range, the rep state machine and the boost
+envelope. Timestamps are plain floats in seconds on any monotonic clock, so
+the same code runs live inside the sensor and offline on recorded traces.
+"""
+
+import enum
+from math import isnan
+
+from .analytics import RepAnalytics
+from .calibration import AdaptiveRange, RangeCalibrator
+from .const import FILTER_NONE, MAX_ACTIVE_BOOSTS, MAX_DISTANCE
+from .envelope import BoostEnvelope
+from .filters import SampleFilter
+from .parameters import PushupParameters
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant
+    np = None
+
+
+class PushupDirection(enum.Enum):
+    """Direction enum for pushup detection."""
+
+    UP = "up"
+    DOWN = "down"
+
+
+class PushupEngine:
+    """Calibration, rep detection and boost envelope of one tracker."""
+
+    def __init__(self, parameters: PushupParameters | None = None) -> None:
+        """Initialize the engine."""
+        self.parameters = parameters or PushupParameters()
+        self.analytics = RepAnalytics()
+        self.calibrating = False
+        self.min_distance = None
+        self.max_distance = None
+        self.calibration_quality = None
+        self.calibrator = RangeCalibrator()
+        self.adaptive = AdaptiveRange()
+        self.direction = PushupDirection.DOWN
+        self.envelope = BoostEnvelope()
+        self.filter = SampleFilter()
+        self.lower_threshold = None
+        self.upper_threshold = None
+        self.set_parameters(self.parameters)
+
+    def set_parameters(self, parameters: PushupParameters) -> None:
+        """Apply a new parameter snapshot."""
+        if parameters.adaptive_thresholds != self.parameters.adaptive_thresholds:
+            self.adaptive.seed(self.min_distance, self.max_distance)
+        self.parameters = parameters
+        if (parameters.filter_type, parameters.filter_window) != (
+            self.filter.kind,
+            self.filter.window,
+        ):
+            self.filter.configure(parameters.filter_type, parameters.filter_window)
+        self.envelope.configure(
+            parameters.rise_time,
+            parameters.boost_time,
+            parameters.fall_time,
+            parameters.boost_value,
+            parameters.envelope_curve,
+            parameters.custom_curve,
+        )
+        self._refresh_thresholds()
+
+    def set_calibration(
+        self,
+        min_distance: float | None,
+        max_distance: float | None,
+        quality: float | None = None,
+    ) -> None:
+        """Apply a calibrated range, e.g. one restored after a restart."""
+        self.min_distance = min_distance
+        self.max_distance = max_distance
+        self.calibration_quality = quality
+        self.adaptive.seed(min_distance, max_distance)
+        self._refresh_thresholds()
+
+    def _refresh_thresholds(self) -> None:
+        """Recompute the detection thresholds from the calibrated range.
+
+        With adaptive thresholds the range followed by the completed reps is
+        used instead; it starts from the calibrated one.
+        """
+        parameters = self.parameters
+        if parameters.adaptive_thresholds:
+            thresholds = parameters.thresholds(self.adaptive.low, self.adaptive.high)
+        else:
+            thresholds = parameters.thresholds(self.min_distance, self.max_distance)
+        if thresholds is None:
+            self.lower_threshold = self.upper_threshold = None
+        else:
+            self.lower_threshold, self.upper_threshold = thresholds
+
+    def start_calibration(self) -> None:
+        """Forget the calibrated range and start collecting a new one."""
+        self.calibrating = True
+        self.set_calibration(None, None)
+        self.calibrator.reset()
+        self.filter.reset()
+        self.envelope.clear()
+        self.analytics.reset()
+        self.direction = PushupDirection.DOWN
+
+    def stop_calibration(self) -> None:
+        """Stop calibration and derive thresholds from the collected range."""
+        self.calibrating = False
+        self.adaptive.seed(self.min_distance, self.max_distance)
+        self._refresh_thresholds()
+
+    def update_calibration(self, distance: float) -> bool:
+        """Add a calibration sample; return True if the range or quality changed."""
+        previous = (self.min_distance, self.max_distance, self.calibration_quality)
+        calibrator = self.calibrator
+        calibrator.add(distance)
+        self.min_distance = calibrator.low
+        self.max_distance = min(calibrator.high, MAX_DISTANCE)
+        self.calibration_quality = calibrator.quality
+        return previous != (
+            self.min_distance,
+            self.max_distance,
+            self.calibration_quality,
+        )
+
+    def process_sample(self, timestamp: float, distance: float) -> bool:
+        """Feed one detection sample; return True if it completed a rep."""
+        if self.lower_threshold is None:
+            return False
+
+        # Toggle direction based on thresholds
+        rep = False
+        if self.direction is PushupDirection.UP:
+            if distance <= self.lower_threshold:
+                self.direction = PushupDirection.DOWN
+                self.envelope.add(timestamp)
+                rep = True
+        elif distance >= self.upper_threshold:
+            self.direction = PushupDirection.UP
+            analytics = self.analytics
+            if (
+                analytics.add(timestamp, distance, True)
+                and self.parameters.adaptive_thresholds
+                and self.adaptive.add(
+                    analytics.trough, min(analytics.peak, MAX_DISTANCE)
+                )
+            ):
+                self._refresh_thresholds()
+            return rep
+        self.analytics.add(timestamp, distance, self.direction is PushupDirection.UP)
+        return rep
+
+    def output(self, now: float) -> int:
+        """Return the sensor output at the given time."""
+        envelope = self.envelope
+        envelope.prune(now)
+        max_value = self.parameters.max_value
+        return min(round((envelope.value(now) / 100) * max_value), max_value)
+
+    def process_samples(self, timestamps, distances, vectorized: bool | None = None):
+        """Feed a batch of samples in time order; return the rep timestamps.
+
+        Samples go through the input filter first, which always streams.
+        Calibrating engines update their range instead. The vectorized NumPy
+        path and the scalar streaming path leave the engine in the same state
+        and return the same list. ``vectorized=None`` uses NumPy if available.
+        """
+        if vectorized is None:
+            vectorized = np is not None
+        if self.filter.kind != FILTER_NONE:
+            sample_filter = self.filter
+            samples = [
+                (timestamp, float(distance))
+                for timestamp, distance in zip(timestamps, distances)
+                if not isnan(distance)
+            ]
+            timestamps = [timestamp for timestamp, _ in samples]
+            distances = [sample_filter(distance) for _, distance in samples]
+        if self.calibrating:
+            for distance in distances:
+                if not isnan(distance):
+                    self.update_calibration(float(distance))
+            return []
+        if self.lower_threshold is None:
+            return []
+        if (
+            not vectorized
+            or self.lower_threshold >= self.upper_threshold
+            or self.parameters.adaptive_thresholds
+        ):
+            # A collapsed range toggles on every sample and adaptive
+            # thresholds move after each rep; keep those scalar.
+            rep_times = []
+            for timestamp, distance in zip(timestamps, distances):
+                if self.process_sample(float(timestamp), float(distance)):
+                    rep_times.append(float(timestamp))
+            return rep_times
+        rep_times = self._detect_vectorized(
+            np.asarray(timestamps, dtype=float), np.asarray(distances, dtype=float)
+        )
+        for rep_time in rep_times:
+            self.envelope.add(rep_time)
+        return rep_times
+
+    def _detect_vectorized(self, timestamps, distances) -> list[float]:
+        """Run the hysteresis state machine over whole arrays."""
+        # +1 where a sample forces UP, -1 where it forces DOWN, 0 otherwise.
+        # NaN compares False on both sides and is skipped like the scalar path.
+        signal = np.zeros(len(distances) + 1, dtype=np.int8)
+        signal[0] = 1 if self.direction is PushupDirection.UP else -1
+        signal[1:][distances >= self.upper_threshold] = 1
+        signal[1:][distances <= self.lower_threshold] = -1
+        # Forward-fill the last forcing sample to get the direction after each.
+        last = np.where(signal != 0, np.arange(len(signal)), 0)
+        state = signal[np.maximum.accumulate(last)]
+        reps = np.flatnonzero((state[:-1] == 1) & (state[1:] == -1))
+        self.direction = PushupDirection.UP if state[-1] == 1 else PushupDirection.DOWN
+        self._analyze_vectorized(timestamps, distances, state)
+        return timestamps[reps].tolist()
+
+    def _analyze_vectorized(self, timestamps, distances, state) -> None:
+        """Feed the rep analytics only the samples that can change them.
+
+        Within a phase the analytics keep just the first sample and the
+        extreme, so those two per phase give the same result as all of them.
+        """
+        if not len(distances):
+            return
+        up = state[1:] == 1
+        starts = np.flatnonzero(up != (state[:-1] == 1))
+        if not len(starts) or starts[0] != 0:
+            starts = np.concatenate(([0], starts))
+        ends = np.append(starts[1:], len(distances))
+        # NaN never moves an extreme; keep it out of argmax/argmin.
+        peaks = np.where(np.isnan(distances), -np.inf, distances)
+        troughs = np.where(np.isnan(distances), np.inf, distances)
+        add = self.analytics.add
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            phase_up = bool(up[start])
+            if phase_up:
+                extreme = start + int(peaks[start:end].argmax())
+            else:
+                extreme = start + int(troughs[start:end].argmin())
+            add(float(timestamps[start]), float(distances[start]), phase_up)
+            if extreme != start:
+                add(float(timestamps[extreme]), float(distances[extreme]), phase_up)
+
+    def envelope_output(self, rep_times, grid, vectorized: bool | None = None):
+        """Return the sensor output at each grid time for the given reps.
+
+        Both inputs must be sorted. The scalar path streams the reps through a
+        fresh bounded envelope. The vectorized path gathers, for every grid
+        time, the boosts that can be live at it, at most the envelope capacity
+        of the newest ones, and classifies each by the same ``now - start``
+        comparisons as the envelope. Both paths therefore agree on the phase
+        of every boost and only sum in a different order, so an output can
+        differ by one step where the scaled value lands exactly on a rounding
+        tie.
+        """
+        if vectorized is None:
+            vectorized = np is not None
+        if not vectorized:
+            engine = PushupEngine(self.parameters)
+            outputs = []
+            index = 0
+            for now in grid:
+                while index < len(rep_times) and rep_times[index] <= now:
+                    engine.envelope.add(rep_times[index])
+                    index += 1
+                outputs.append(engine.output(now))
+            return outputs
+
+        params = self.parameters
+        starts = np.asarray(rep_times, dtype=float)
+        grid = np.asarray(grid, dtype=float)
+        max_value = params.max_value
+        rise_end = params.rise_time
+        hold_end = rise_end + params.boost_time
+        fall_end = hold_end + params.fall_time
+        if not len(starts) or not len(grid):
+            return np.zeros(len(grid))
+
+        # For each grid time, the boosts the envelope holds: those added by
+        # then, at most the newest MAX_ACTIVE_BOOSTS of them, that can still
+        # be live. The window is a little wider than needed; the exact
+        # comparisons below decide its edges.
+        added = np.searchsorted(starts, grid, side="right")
+        first = np.searchsorted(starts, grid - fall_end - 1e-6, side="left")
+        first = np.maximum(first, added - MAX_ACTIVE_BOOSTS)
+        index = first[:, None] + np.arange(int((added - first).max()))
+        elapsed = grid[:, None] - starts[np.minimum(index, len(starts) - 1)]
+        started = (index < added[:, None]) & (elapsed >= 0)
+
+        table = self.envelope.table
+        if table is not None:
+            table = np.asarray(table)
+            live = started & (elapsed < fall_end)
+            position = np.where(live, elapsed, 0) * ((len(table) - 1) / fall_end)
+            point = np.minimum(position.astype(np.intp), len(table) - 2)
+            low = table[point]
+            values = low + (position - point) * (table[point + 1] - low)
+            total = np.where(live, values, 0).sum(axis=1)
+        else:
+            value = params.boost_value
+            rising = started & (elapsed < rise_end)
+            holding = started & (elapsed >= rise_end) & (elapsed <= hold_end)
+            falling = started & (elapsed > hold_end) & (elapsed < fall_end)
+            total = holding.sum(axis=1) * float(value)
+            if rise_end > 0:
+                total += np.where(rising, value * elapsed / rise_end, 0).sum(axis=1)
+            if params.fall_time > 0:
+                total += np.where(
+                    falling, value * (fall_end - elapsed) / params.fall_time, 0
+                ).sum(axis=1)
+        return np.minimum(np.round(total / 100 * max_value), max_value)
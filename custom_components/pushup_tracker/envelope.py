@@ -0,0 +1,200 @@
+"""Boost envelope for Pushup Tracker."""
+
+from array import array
+
+from .const import (
+    CURVE_LINEAR,
+    CURVE_TABLE_SIZE,
+    DEFAULT_BOOST_TIME,
+    DEFAULT_BOOST_VALUE,
+    DEFAULT_FALL_TIME,
+    DEFAULT_RISE_TIME,
+    MAX_ACTIVE_BOOSTS,
+)
+from .curves import build_table
+
+
+class BoostEnvelope:
+    """Sum of rise/hold/fall boosts kept in a fixed-capacity ring buffer.
+
+    Only the start time of each boost is stored. Start times must be added in
+    non-decreasing order, so the live boosts are always ordered oldest to
+    newest and expire from the head of the ring. When the ring is full the
+    oldest boost is dropped to make room.
+
+    The linear curve is evaluated exactly. Other curves are sampled into a
+    lookup table whenever the shape changes, and each boost then costs one
+    interpolated table lookup.
+    """
+
+    __slots__ = (
+        "_starts",
+        "_capacity",
+        "_head",
+        "_count",
+        "_rise_time",
+        "_hold_end",
+        "_fall_end",
+        "_fall_time",
+        "_boost_value",
+        "_shape",
+        "_table",
+        "_table_scale",
+        "dropped",
+    )
+
+    def __init__(self, capacity: int = MAX_ACTIVE_BOOSTS) -> None:
+        """Initialize the envelope."""
+        self._starts = array("d", bytes(8 * capacity))
+        self._capacity = capacity
+        self._head = 0
+        self._count = 0
+        self.dropped = 0
+        self._shape = None
+        self._table = None
+        self.configure(
+            DEFAULT_RISE_TIME,
+            DEFAULT_BOOST_TIME,
+            DEFAULT_FALL_TIME,
+            DEFAULT_BOOST_VALUE,
+        )
+
+    def configure(
+        self,
+        rise_time: float,
+        boost_time: float,
+        fall_time: float,
+        boost_value: float,
+        curve: str = CURVE_LINEAR,
+        points: tuple[float, ...] = (),
+    ) -> None:
+        """Set the shape of a single boost."""
+        shape = (rise_time, boost_time, fall_time, boost_value, curve, points)
+        if shape == self._shape:
+            return
+        self._shape = shape
+        duration = rise_time + boost_time + fall_time
+        if curve == CURVE_LINEAR or duration <= 0:
+            self._table = None
+        else:
+            self._table = build_table(
+                curve, points, rise_time, boost_time, fall_time, boost_value
+            )
+            self._table_scale = CURVE_TABLE_SIZE / duration
+        self._rise_time = rise_time
+        self._hold_end = rise_time + boost_time
+        self._fall_end = rise_time + boost_time + fall_time
+        self._fall_time = fall_time
+        self._boost_value = boost_value
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the preallocated start time buffer."""
+        return self._starts.itemsize * self._capacity
+
+    def __len__(self) -> int:
+        """Return the number of live boosts."""
+        return self._count
+
+    def add(self, start_time: float) -> None:
+        """Start a new boost at the given time."""
+        if self._count == self._capacity:
+            self._head = (self._head + 1) % self._capacity
+            self._count -= 1
+            self.dropped += 1
+        self._starts[(self._head + self._count) % self._capacity] = start_time
+        self._count += 1
+
+    def clear(self) -> None:
+        """Drop all boosts."""
+        self._head = 0
+        self._count = 0
+
+    def prune(self, now: float) -> None:
+        """Drop boosts that have fully decayed."""
+        starts = self._starts
+        capacity = self._capacity
+        fall_end = self._fall_end
+        while self._count and now - starts[self._head] > fall_end:
+            self._head = (self._head + 1) % capacity
+            self._count -= 1
+
+    def value(self, now: float) -> float:
+        """Return the summed boost value at the given time."""
+        if self._table is not None:
+            return self._table_value(now)
+        starts = self._starts
+        capacity = self._capacity
+        rise_time = self._rise_time
+        hold_end = self._hold_end
+        fall_end = self._fall_end
+        boost_value = self._boost_value
+        total = 0.0
+        holding = 0
+        index = self._head
+        for _ in range(self._count):
+            elapsed = now - starts[index]
+            index += 1
+            if index == capacity:
+                index = 0
+            if elapsed < rise_time:
+                if elapsed > 0:
+                    total += boost_value * elapsed / rise_time
+            elif elapsed <= hold_end:
+                holding += 1
+            elif elapsed < fall_end:
+                total += boost_value * (fall_end - elapsed) / self._fall_time
+        return total + holding * boost_value
+
+    def _table_value(self, now: float) -> float:
+        """Return the summed boost value from the lookup table."""
+        starts = self._starts
+        capacity = self._capacity
+        table = self._table
+        scale = self._table_scale
+        fall_end = self._fall_end
+        total = 0.0
+        index = self._head
+        for _ in range(self._count):
+            elapsed = now - starts[index]
+            index += 1
+            if index == capacity:
+                index = 0
+            if 0 <= elapsed < fall_end:
+                position = elapsed * scale
+                point = int(position)
+                # Rounding can land on the last entry, which is always 0.
+                if point < CURVE_TABLE_SIZE:
+                    low = table[point]
+                    total += low + (position - point) * (table[point + 1] - low)
+        return total
+
+    @property
+    def table(self) -> array | None:
+        """Return the lookup table of a non-linear curve."""
+        return self._table
+
+    def next_update_delay(self, now: float, interval: float) -> float | None:
+        """Return seconds until the value next changes, or None when idle.
+
+        While any boost is rising or falling the value changes continuously, so
+        ``interval`` is returned. While every boost is holding, the delay runs
+        until the first of them starts falling.
+        """
+        if not self._count:
+            return None
+        starts = self._starts
+        rise_time = self._rise_time
+        hold_end = self._hold_end
+        delay = None
+        index = self._head
+        for _ in range(self._count):
+            elapsed = now - starts[index]
+            index = (index + 1) % self._capacity
+            if elapsed < rise_time or elapsed > hold_end:
+                return interval
+            if delay is None:
+                # Boosts are ordered oldest first, so this one falls first.
+                delay = hold_end - elapsed
+        # Land just past the boundary so the boost is already falling.
+        return delay + interval / 10
@@ -0,0 +1,102 @@
+"""Streaming input filters for Pushup Tracker."""
+
+from array import array
+from bisect import bisect_left, insort
+
+from .const import (
+    DEFAULT_FILTER_TYPE,
+    DEFAULT_FILTER_WINDOW,
+    FILTER_EMA,
+    FILTER_MEDIAN,
+    FILTER_NONE,
+    MAX_FILTER_WINDOW,
+    OUTLIER_MIN_DEVIATION,
+    OUTLIER_THRESHOLD,
+)
+
+
+class SampleFilter:
+    """Median, EMA or outlier-rejecting filter over a fixed-size window.
+
+    The window is a preallocated ring plus a sorted copy kept up to date with
+    one bisect removal and one insertion per sample, so the per-sample cost
+    is bounded by ``MAX_FILTER_WINDOW`` and nothing is allocated.
+
+    The outlier filter passes samples through unchanged unless they are
+    further from the window median than ``OUTLIER_THRESHOLD`` times the
+    running typical deviation, in which case the median is returned instead.
+    """
+
+    __slots__ = (
+        "kind",
+        "window",
+        "_ring",
+        "_sorted",
+        "_index",
+        "_count",
+        "_alpha",
+        "_value",
+        "_deviation",
+    )
+
+    def __init__(
+        self, kind: str = DEFAULT_FILTER_TYPE, window: int = DEFAULT_FILTER_WINDOW
+    ) -> None:
+        """Initialize the filter."""
+        self._ring = array("d", bytes(8 * MAX_FILTER_WINDOW))
+        self._sorted = array("d")
+        self.configure(kind, window)
+
+    def configure(self, kind: str, window: int) -> None:
+        """Change the filter type and window, restarting the filter."""
+        self.kind = kind
+        self.window = max(1, min(int(window), MAX_FILTER_WINDOW))
+        self._alpha = 2 / (self.window + 1)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples seen so far."""
+        self._index = 0
+        self._count = 0
+        del self._sorted[:]
+        self._value = None
+        self._deviation = 0.0
+
+    def __call__(self, sample: float) -> float:
+        """Filter one sample."""
+        kind = self.kind
+        if kind == FILTER_NONE:
+            return sample
+        if kind == FILTER_EMA:
+            if self._value is None:
+                self._value = sample
+            else:
+                self._value += self._alpha * (sample - self._value)
+            return self._value
+
+        median = self._push(sample)
+        if kind == FILTER_MEDIAN:
+            return median
+
+        deviation = abs(sample - median)
+        limit = max(OUTLIER_THRESHOLD * self._deviation, OUTLIER_MIN_DEVIATION)
+        # Winsorize so a burst of glitches cannot inflate the typical deviation.
+        self._deviation += self._alpha * (min(deviation, limit) - self._deviation)
+        if deviation > limit and self._count == self.window:
+            return median
+        return sample
+
+    def _push(self, sample: float) -> float:
+        """Add a sample to the window and return the window median."""
+        ordered = self._sorted
+        if self._count == self.window:
+            del ordered[bisect_left(ordered, self._ring[self._index])]
+        else:
+            self._count += 1
+        self._ring[self._index] = sample
+        self._index = (self._index + 1) % self.window
+        insort(ordered, sample)
+        middle = self._count // 2
+        if self._count % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
@@ -0,0 +1,63 @@
+"""Fusion of several distance sources for Pushup Tracker.
+
+Samples are fused in the order they arrive. Home Assistant stamps a state
+when it is written and reports it right away, so live samples of different
+sources never arrive out of order and there is nothing to realign. When any
+source reports, the last sample of every other source is held while it is
+recent enough, and the values are combined into one detection sample.
+"""
+
+from array import array
+
+from .const import FUSION_MAX_AGE, FUSION_MEDIAN, FUSION_WEIGHTED
+
+
+def parse_weights(text: str, count: int) -> tuple[float, ...]:
+    """Parse comma separated source weights; empty means equal weights."""
+    if not text.strip():
+        return (1.0,) * count
+    weights = tuple(float(value) for value in text.split(","))
+    if len(weights) != count or min(weights) <= 0:
+        raise ValueError("One positive weight per input entity is required")
+    return weights
+
+
+class SampleFusion:
+    """Combination of the latest sample of several distance sources."""
+
+    __slots__ = ("method", "weights", "max_age", "_times", "_values")
+
+    def __init__(
+        self,
+        weights: tuple[float, ...],
+        method: str = FUSION_MEDIAN,
+        max_age: float = FUSION_MAX_AGE,
+    ) -> None:
+        """Initialize the fusion of ``len(weights)`` sources."""
+        self.method = method
+        self.weights = weights
+        self.max_age = max_age
+        self._times = array("d", [float("-inf")] * len(weights))
+        self._values = array("d", bytes(8 * len(weights)))
+
+    def add(self, source: int, timestamp: float, distance: float) -> float | None:
+        """Add a sample of one source; return the fused distance at its time."""
+        if timestamp < self._times[source]:
+            return None
+        self._times[source] = timestamp
+        self._values[source] = distance
+        oldest = timestamp - self.max_age
+        values = []
+        weights = []
+        for sample_time, value, weight in zip(self._times, self._values, self.weights):
+            if sample_time >= oldest:
+                values.append(value)
+                weights.append(weight)
+
+        if self.method == FUSION_WEIGHTED:
+            return sum(v * w for v, w in zip(values, weights)) / sum(weights)
+        values.sort()
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
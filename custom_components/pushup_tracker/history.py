@@ -0,0 +1,78 @@
+"""Persistent rep and session history for Pushup Tracker."""
+
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, HISTORY_RETENTION_DAYS, HISTORY_SAVE_DELAY, SESSION_GAP
+
+STORAGE_VERSION = 1
+
+
+class PushupHistory:
+    """Rep log of one tracker grouped into sessions.
+
+    On disk every session is ``[start_ms, [delta_ms, ...]]``: the wall-clock
+    time of its first rep in milliseconds followed by the gap to the previous
+    rep for every rep, the first one being 0. Reps are saved in batches at
+    most every ``HISTORY_SAVE_DELAY`` seconds and sessions older than
+    ``HISTORY_RETENTION_DAYS`` are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the history."""
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.history.{entry_id}")
+        self.sessions: list[list] = []
+        self._last_rep_ms = None
+
+    async def async_load(self) -> None:
+        """Load the history from disk."""
+        data = await self._store.async_load()
+        if data:
+            self.sessions = data["sessions"]
+        self._prune(int(time.time() * 1000))
+        if self.sessions:
+            start_ms, deltas = self.sessions[-1]
+            self._last_rep_ms = start_ms + sum(deltas)
+
+    @callback
+    def async_add_rep(self, timestamp: float) -> None:
+        """Log a rep detected at the given monotonic time."""
+        rep_ms = int((time.time() - (time.monotonic() - timestamp)) * 1000)
+        last_rep_ms = self._last_rep_ms
+        if last_rep_ms is None or rep_ms - last_rep_ms > SESSION_GAP * 1000:
+            self._prune(rep_ms)
+            self.sessions.append([rep_ms, [0]])
+        else:
+            # Clamp so deltas stay non-negative if the wall clock stepped back.
+            self.sessions[-1][1].append(max(rep_ms - last_rep_ms, 0))
+            rep_ms = max(rep_ms, last_rep_ms)
+        self._last_rep_ms = rep_ms
+        self._store.async_delay_save(self._data_to_save, HISTORY_SAVE_DELAY)
+
+    def _prune(self, now_ms: int) -> None:
+        """Drop sessions that started before the retention window."""
+        cutoff = now_ms - HISTORY_RETENTION_DAYS * 86400 * 1000
+        keep = 0
+        while keep < len(self.sessions) and self.sessions[keep][0] < cutoff:
+            keep += 1
+        if keep:
+            del self.sessions[:keep]
+
+    def _data_to_save(self) -> dict:
+        """Return the data to store."""
+        return {"sessions": self.sessions}
+
+    @property
+    def total_reps(self) -> int:
+        """Return the number of reps in the history."""
+        return sum(len(deltas) for _, deltas in self.sessions)
+
+    async def async_save(self) -> None:
+        """Write pending reps to disk now."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the history from disk."""
+        await self._store.async_remove()
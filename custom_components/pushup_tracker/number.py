@@ -3,17 +3,10 @@
 from homeassistant.components.number import RestoreNumber
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
-from .const import (
-    DEFAULT_BOOST_TIME,
-    DEFAULT_BOOST_VALUE,
-    DEFAULT_FALL_TIME,
-    DEFAULT_MAX_VALUE,
-    DEFAULT_RISE_TIME,
-    DEFAULT_TOLERANCE,
-    DOMAIN,
-)
+from .const import DOMAIN, MAX_FILTER_WINDOW
+from .parameters import PushupParameters
 
 
 async def async_setup_entry(
@@ -23,7 +16,6 @@ async def async_setup_entry(
     numbers = [
         {
             "key": "max_value",
-            "default": DEFAULT_MAX_VALUE,
             "min_val": 1,
             "max_val": 100,
             "step": 1,
@@ -32,7 +24,6 @@ async def async_setup_entry(
         },
         {
             "key": "tolerance",
-            "default": DEFAULT_TOLERANCE,
             "min_val": 0,
             "max_val": 30,
             "step": 1,
@@ -41,7 +32,6 @@ async def async_setup_entry(
         },
         {
             "key": "rise_time",
-            "default": DEFAULT_RISE_TIME,
             "min_val": 0,
             "max_val": 5,
             "step": 0.1,
@@ -50,7 +40,6 @@ async def async_setup_entry(
         },
         {
             "key": "boost_time",
-            "default": DEFAULT_BOOST_TIME,
             "min_val": 0,
             "max_val": 5,
             "step": 0.1,
@@ -59,7 +48,6 @@ async def async_setup_entry(
         },
         {
             "key": "fall_time",
-            "default": DEFAULT_FALL_TIME,
             "min_val": 0,
             "max_val": 5,
             "step": 0.1,
@@ -68,13 +56,28 @@ async def async_setup_entry(
         },
         {
             "key": "boost_value",
-            "default": DEFAULT_BOOST_VALUE,
             "min_val": 0,
             "max_val": 100,
             "step": 1,
             "name_suffix": "Boost Value",
             "unique_id_suffix": "boost_value",
         },
+        {
+            "key": "max_update_rate",
+            "min_val": 0.5,
+            "max_val": 10,
+            "step": 0.5,
+            "name_suffix": "Max Update Rate (Hz)",
+            "unique_id_suffix": "max_update_rate",
+        },
+        {
+            "key": "filter_window",
+            "min_val": 1,
+            "max_val": MAX_FILTER_WINDOW,
+            "step": 1,
+            "name_suffix": "Filter Window (Samples)",
+            "unique_id_suffix": "filter_window",
+        },
     ]
     entities = [ConfigNumber(config_entry, **params) for params in numbers]
     async_add_entities(entities)
@@ -87,7 +90,6 @@ class ConfigNumber(RestoreNumber):
         self,
         config_entry: ConfigEntry,
         key: str,
-        default: float,
         min_val: float,
         max_val: float,
         step: float,
@@ -97,7 +99,6 @@ class ConfigNumber(RestoreNumber):
         """Initialize the number entity."""
         self._config_entry = config_entry
         self.key = key
-        self.default = default
         self._attr_native_min_value = min_val
         self._attr_native_max_value = max_val
         self._attr_native_step = step
@@ -110,19 +111,19 @@ class ConfigNumber(RestoreNumber):
         return self.hass.data[DOMAIN][self._config_entry.entry_id]
 
     async def async_added_to_hass(self):
-        """Restore state."""
+        """Follow the parameter store, which starts with the restored value."""
         await super().async_added_to_hass()
-        state = await self.async_get_last_number_data()
-        if state:
-            self.entry_data[self.key] = state.native_value
-
-        self.entry_data["number_update_callbacks"].append(self.async_write_ha_state)
+        self.async_on_remove(
+            self.entry_data["parameters"].async_subscribe(
+                self._async_parameters_changed
+            )
+        )
         self.async_write_ha_state()
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Unregister callbacks."""
-        await super().async_will_remove_from_hass()
-        self.entry_data["number_update_callbacks"].remove(self.async_write_ha_state)
+    @callback
+    def _async_parameters_changed(self, parameters: PushupParameters) -> None:
+        """Write the state after the parameters changed."""
+        self.async_write_ha_state()
 
     @property
     def name(self):
@@ -144,9 +145,8 @@ class ConfigNumber(RestoreNumber):
     @property
     def native_value(self):
         """Return the current value."""
-        return self.entry_data.get(self.key, self.default)
+        return self.entry_data["parameters"][self.key]
 
-    def set_native_value(self, value: float):
-        """Set the value and update the sensor."""
-        self.entry_data[self.key] = value
-        self.schedule_update_ha_state()
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value; the sensor picks it up with the next notification."""
+        self.entry_data["parameters"].async_set(self.key, value)
@@ -0,0 +1,127 @@
+"""Tunable parameters for Pushup Tracker."""
+
+import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, fields, replace
+from typing import Any
+
+from .const import (
+    DEFAULT_ADAPTIVE_THRESHOLDS,
+    DEFAULT_BOOST_TIME,
+    DEFAULT_BOOST_VALUE,
+    DEFAULT_ENVELOPE_CURVE,
+    DEFAULT_FALL_TIME,
+    DEFAULT_FILTER_TYPE,
+    DEFAULT_FILTER_WINDOW,
+    DEFAULT_IMMEDIATE_OUTPUT,
+    DEFAULT_MAX_UPDATE_RATE,
+    DEFAULT_MAX_VALUE,
+    DEFAULT_RISE_TIME,
+    DEFAULT_TOLERANCE,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PushupParameters:
+    """Immutable snapshot of the tunable parameters of one tracker."""
+
+    max_value: float = DEFAULT_MAX_VALUE
+    tolerance: float = DEFAULT_TOLERANCE
+    rise_time: float = DEFAULT_RISE_TIME
+    boost_time: float = DEFAULT_BOOST_TIME
+    fall_time: float = DEFAULT_FALL_TIME
+    boost_value: float = DEFAULT_BOOST_VALUE
+    max_update_rate: float = DEFAULT_MAX_UPDATE_RATE
+    filter_type: str = DEFAULT_FILTER_TYPE
+    filter_window: int = DEFAULT_FILTER_WINDOW
+    immediate_output: bool = DEFAULT_IMMEDIATE_OUTPUT
+    adaptive_thresholds: bool = DEFAULT_ADAPTIVE_THRESHOLDS
+    envelope_curve: str = DEFAULT_ENVELOPE_CURVE
+    custom_curve: tuple[float, ...] = ()
+
+    def thresholds(
+        self, min_distance: float | None, max_distance: float | None
+    ) -> tuple[float, float] | None:
+        """Return the (lower, upper) detection thresholds for a calibrated range."""
+        if min_distance is None or max_distance is None:
+            return None
+        margin = (self.tolerance / 100) * (max_distance - min_distance)
+        return min_distance + margin, max_distance - margin
+
+
+# Scalar fields are cast to their annotated type; the rest are tuples.
+_FIELD_TYPES = {
+    field.name: field.type if field.type in (float, int, str, bool) else tuple
+    for field in fields(PushupParameters)
+}
+
+# Everything the reset button restores; the custom curve comes from the options.
+TUNABLE_KEYS = tuple(key for key in _FIELD_TYPES if key != "custom_curve")
+
+
+class ParameterStore:
+    """Typed, versioned parameters of one tracker.
+
+    Setters swap in a new immutable snapshot and bump ``version``. Subscribers
+    are called once with the latest snapshot on the next event loop iteration,
+    however many values changed in between, so a reset or a tuning result
+    costs one rebuild.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        parameters: PushupParameters | None = None,
+    ) -> None:
+        """Initialize the store."""
+        self._loop = loop
+        self._parameters = parameters or PushupParameters()
+        self._listeners: list[Callable[[PushupParameters], None]] = []
+        self._notify_handle: asyncio.Handle | None = None
+        self.version = 0
+
+    @property
+    def parameters(self) -> PushupParameters:
+        """Return the current snapshot."""
+        return self._parameters
+
+    def __getitem__(self, key: str) -> Any:
+        """Return one parameter value."""
+        return getattr(self._parameters, key)
+
+    def async_set(self, key: str, value: Any) -> None:
+        """Set one parameter."""
+        self.async_update({key: value})
+
+    def async_update(self, values: Mapping[str, Any]) -> None:
+        """Set several parameters as one change."""
+        try:
+            changes = {key: _FIELD_TYPES[key](value) for key, value in values.items()}
+        except KeyError as err:
+            raise ValueError(f"Unknown parameter {err}") from None
+        parameters = replace(self._parameters, **changes)
+        if parameters == self._parameters:
+            return
+        self._parameters = parameters
+        self.version += 1
+        if self._notify_handle is None:
+            self._notify_handle = self._loop.call_soon(self._async_notify)
+
+    def async_reset(self) -> None:
+        """Restore the defaults of every tunable parameter."""
+        defaults = PushupParameters()
+        self.async_update({key: getattr(defaults, key) for key in TUNABLE_KEYS})
+
+    def async_subscribe(
+        self, listener: Callable[[PushupParameters], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` after changes; return a function to unsubscribe."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _async_notify(self) -> None:
+        """Hand the latest snapshot to every subscriber."""
+        self._notify_handle = None
+        parameters = self._parameters
+        for listener in list(self._listeners):
+            listener(parameters)
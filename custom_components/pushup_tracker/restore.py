@@ -0,0 +1,71 @@
+"""Batch restore of the tracker state saved before a restart."""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er, restore_state
+
+from .const import (
+    ATTR_CALIBRATION_QUALITY,
+    ATTR_MAX_DISTANCE,
+    ATTR_MIN_DISTANCE,
+    CURVE_TYPES,
+    FILTER_TYPES,
+)
+from .parameters import TUNABLE_KEYS
+
+# Parameters restored from select entities and their valid options.
+_OPTIONS = {"filter_type": FILTER_TYPES, "envelope_curve": CURVE_TYPES}
+
+
+def _restored_value(key: str, stored: restore_state.StoredState):
+    """Return the parameter value saved by one entity, or None."""
+    state = stored.state.state
+    if key in _OPTIONS:
+        return state if state in _OPTIONS[key] else None
+    if state in ("on", "off"):
+        return state == "on"
+    if stored.extra_data is not None:
+        # Number entities keep their exact value next to the state.
+        value = stored.extra_data.as_dict().get("native_value")
+        if value is not None:
+            return value
+    try:
+        return float(state)
+    except ValueError:
+        return None
+
+
+def async_restore_entry(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> tuple[dict, tuple | None]:
+    """Return the saved parameters and calibration of a config entry.
+
+    Reads every entity of the entry in one pass over the entity registry and
+    the restore cache, so the parameter store starts with the saved values
+    instead of each entity applying its own as it is added.
+    """
+    last_states = restore_state.async_get(hass).last_states
+    entity_ids = {
+        entity.unique_id: entity.entity_id
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+    }
+
+    values = {}
+    for key in TUNABLE_KEYS:
+        entity_id = entity_ids.get(f"{entry.entry_id}_{key}")
+        stored = last_states.get(entity_id) if entity_id else None
+        if stored is not None and (value := _restored_value(key, stored)) is not None:
+            values[key] = value
+
+    calibration = None
+    entity_id = entity_ids.get(f"{entry.entry_id}_sensor")
+    if entity_id and (stored := last_states.get(entity_id)):
+        attributes = stored.state.attributes
+        calibration = (
+            attributes.get(ATTR_MIN_DISTANCE),
+            attributes.get(ATTR_MAX_DISTANCE),
+            attributes.get(ATTR_CALIBRATION_QUALITY),
+        )
+    return values, calibration
@@ -0,0 +1,101 @@
+"""Select platform for Pushup Tracker."""
+
+from homeassistant.components.select import SelectEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from .const import CURVE_TYPES, DOMAIN, FILTER_TYPES
+from .parameters import PushupParameters
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up select entities."""
+    async_add_entities(
+        [
+            ConfigSelect(
+                config_entry,
+                key="filter_type",
+                options=FILTER_TYPES,
+                name_suffix="Filter Type",
+                unique_id_suffix="filter_type",
+            ),
+            ConfigSelect(
+                config_entry,
+                key="envelope_curve",
+                options=CURVE_TYPES,
+                name_suffix="Envelope Curve",
+                unique_id_suffix="envelope_curve",
+            ),
+        ]
+    )
+
+
+class ConfigSelect(RestoreEntity, SelectEntity):
+    """A generic select entity for configuration parameters."""
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        key: str,
+        options: list[str],
+        name_suffix: str,
+        unique_id_suffix: str,
+    ) -> None:
+        """Initialize the select entity."""
+        self._config_entry = config_entry
+        self.key = key
+        self._attr_options = options
+        self.name_suffix = name_suffix
+        self.unique_id_suffix = unique_id_suffix
+
+    @property
+    def entry_data(self):
+        """Return the entry data for this select."""
+        return self.hass.data[DOMAIN][self._config_entry.entry_id]
+
+    async def async_added_to_hass(self):
+        """Follow the parameter store, which starts with the restored value."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.entry_data["parameters"].async_subscribe(
+                self._async_parameters_changed
+            )
+        )
+
+    @callback
+    def _async_parameters_changed(self, parameters: PushupParameters) -> None:
+        """Write the state after the parameters changed."""
+        self.async_write_ha_state()
+
+    @property
+    def name(self):
+        """Return the name of the select entity."""
+        return f"{self._config_entry.data[CONF_NAME]} {self.name_suffix}"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID for the select entity."""
+        return f"{self._config_entry.entry_id}_{self.unique_id_suffix}"
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+        }
+
+    @property
+    def current_option(self):
+        """Return the selected option."""
+        return self.entry_data["parameters"][self.key]
+
+    async def async_select_option(self, option: str) -> None:
+        """Select an option; the sensor picks it up with the next notification."""
+        self.entry_data["parameters"].async_set(self.key, option)
@@ -1,70 +1,220 @@
 """Sensor platform for Pushup Tracker."""
 
-from datetime import datetime, timedelta
-import enum
-
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from collections.abc import Callable
+from datetime import timedelta
+from math import isfinite
+import time
+
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, EntityCategory
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 
+from .actuator import ActuatorBinding
+from .analytics import RepAnalytics
 from .const import (
     ATTR_CALIBRATING,
+    ATTR_CALIBRATION_QUALITY,
     ATTR_DIRECTION,
+    ATTR_LAST_REP,
     ATTR_MAX_DISTANCE,
     ATTR_MIN_DISTANCE,
-    CONF_INPUT_ENTITY,
-    DEFAULT_BOOST_TIME,
-    DEFAULT_BOOST_VALUE,
-    DEFAULT_FALL_TIME,
-    DEFAULT_MAX_VALUE,
-    DEFAULT_RISE_TIME,
-    DEFAULT_TOLERANCE,
+    CONF_ACTUATOR_DELTA,
+    CONF_ACTUATOR_ENTITY,
+    CONF_ACTUATOR_MAX_RATE,
+    CONF_ACTUATOR_SERVICE,
+    CONF_FUSION_METHOD,
+    CONF_FUSION_WEIGHTS,
+    CONF_INPUT_ENTITIES,
+    DATA_COORDINATOR,
+    DEFAULT_ACTUATOR_DELTA,
+    DEFAULT_ACTUATOR_MAX_RATE,
+    DEFAULT_FUSION_METHOD,
+    DEFAULT_MAX_UPDATE_RATE,
     DOMAIN,
     MANUFACTURER,
-    MAX_DISTANCE,
     MODEL,
     SW_VERSION,
+    UPDATE_INTERVAL,
 )
+from .coalescer import WriteCoalescer
+from .engine import PushupDirection, PushupEngine
+from .fusion import SampleFusion, parse_weights
+from .parameters import PushupParameters
 
-SCAN_INTERVAL = timedelta(milliseconds=100)
-DATA_TIMEOUT = 0.5  # seconds without data before decay starts
-
-
-class PushupDirection(enum.Enum):
-    """Direction enum for pushup detection."""
-
-    UP = "up"
-    DOWN = "down"
+SCAN_INTERVAL = timedelta(seconds=10)  # only the diagnostic sensors poll
 
 
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: callable
 ):
     """Set up sensor platform."""
-    input_entity = config_entry.data[CONF_INPUT_ENTITY]
-    sensor = PushupSensor(config_entry, input_entity)
-    async_add_entities([sensor])
+    input_entities = config_entry.data[CONF_INPUT_ENTITIES]
+    sensor = PushupSensor(config_entry, input_entities)
+    debug_sensors = [
+        {
+            "key": "input_rate",
+            "name_suffix": "Input Rate",
+            "unit": "samples/s",
+            "value": lambda stats, rate: rate(stats.samples, 1),
+        },
+        {
+            "key": "dropped_samples",
+            "name_suffix": "Dropped Samples",
+            "unit": "samples",
+            "value": lambda stats, rate: stats.dropped,
+            "state_class": SensorStateClass.TOTAL_INCREASING,
+        },
+        {
+            "key": "input_time",
+            "name_suffix": "Input Handler Time",
+            "unit": "µs",
+            "value": lambda stats, rate: stats.input_time.percentile(0.95),
+            "histogram": lambda stats: stats.input_time,
+        },
+        {
+            "key": "tick_time",
+            "name_suffix": "Update Time",
+            "unit": "µs",
+            "value": lambda stats, rate: stats.tick_time.percentile(0.95),
+            "histogram": lambda stats: stats.tick_time,
+        },
+        {
+            "key": "active_boosts",
+            "name_suffix": "Active Boosts",
+            "unit": "boosts",
+            "value": lambda stats, rate: stats.boosts,
+            "peak": lambda stats: stats.peak_boosts,
+        },
+        {
+            "key": "output_latency",
+            "name_suffix": "Output Latency",
+            "unit": "ms",
+            "value": lambda stats, rate: stats.latency.percentiles().get("p50"),
+            "latency": True,
+        },
+        {
+            "key": "state_writes",
+            "name_suffix": "State Writes",
+            "unit": "writes/min",
+            "value": lambda stats, rate: rate(stats.state_writes, 60),
+        },
+    ]
+    analytics_sensors = [
+        {
+            "key": "rep_depth",
+            "name_suffix": "Rep Depth",
+            "unit": "m",
+            "digits": 3,
+            "value": lambda analytics: analytics.depth,
+            "stats": lambda analytics: analytics.depth_stats,
+        },
+        {
+            "key": "rep_duration",
+            "name_suffix": "Rep Duration",
+            "unit": "s",
+            "digits": 2,
+            "value": lambda analytics: analytics.duration,
+            "stats": lambda analytics: analytics.duration_stats,
+        },
+        {
+            "key": "eccentric_time",
+            "name_suffix": "Eccentric Time",
+            "unit": "s",
+            "digits": 2,
+            "value": lambda analytics: analytics.eccentric,
+        },
+        {
+            "key": "concentric_time",
+            "name_suffix": "Concentric Time",
+            "unit": "s",
+            "digits": 2,
+            "value": lambda analytics: analytics.concentric,
+        },
+        {
+            "key": "cadence",
+            "name_suffix": "Cadence",
+            "unit": "reps/min",
+            "digits": 1,
+            "value": lambda analytics: analytics.cadence,
+            "stats": lambda analytics: analytics.cadence_stats,
+        },
+        {
+            "key": "fatigue_trend",
+            "name_suffix": "Fatigue Trend",
+            "unit": "%/rep",
+            "digits": 2,
+            "value": lambda analytics: analytics.fatigue_trend,
+        },
+    ]
+    analytics = sensor.engine.analytics
+    async_add_entities(
+        [
+            sensor,
+            PushupRepCountSensor(config_entry),
+            *(
+                PushupAnalyticsSensor(config_entry, analytics, **params)
+                for params in analytics_sensors
+            ),
+            *(PushupDebugSensor(config_entry, **params) for params in debug_sensors),
+        ]
+    )
 
-    hass.data[DOMAIN][config_entry.entry_id]["sensor"] = sensor
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    entry_data["sensor"] = sensor
+    entry_data["sensor_ready"].set_result(sensor)
 
 
 class PushupSensor(RestoreEntity, SensorEntity):
     """Representation of a Pushup Tracker Sensor."""
 
-    def __init__(self, config_entry: ConfigEntry, input_entity: str) -> None:
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_MIN_DISTANCE,
+            ATTR_MAX_DISTANCE,
+            ATTR_DIRECTION,
+            ATTR_CALIBRATING,
+            ATTR_CALIBRATION_QUALITY,
+            ATTR_LAST_REP,
+        }
+    )
+
+    def __init__(self, config_entry: ConfigEntry, input_entities: list[str]) -> None:
         """Initialize the sensor."""
         self._config_entry = config_entry
-        self._input_entity = input_entity
+        self._input_entities = input_entities
+        self._sources = {
+            entity_id: index for index, entity_id in enumerate(input_entities)
+        }
+        self._fusion = None
+        if len(input_entities) > 1:
+            self._fusion = SampleFusion(
+                parse_weights(
+                    config_entry.data.get(CONF_FUSION_WEIGHTS, ""), len(input_entities)
+                ),
+                config_entry.data.get(CONF_FUSION_METHOD, DEFAULT_FUSION_METHOD),
+            )
         self._state = 0
-        self._calibrating = False
-        self._min_distance = None
-        self._max_distance = None
-
-        self._current_direction = PushupDirection.DOWN
-        self._active_boosts = []
+        self._engine = PushupEngine()
+        self._coalescer = None
+        self._coordinator = None
+        self._actuator = None
+        self._capture = None
+        self._parameters = None
+        self._parameters_version = None
+        self._stats = None
+        self._last_sample_time = float("-inf")
+        self._last_rep = None
+        self._latency_source = None
+        self._latency_baseline = 0
 
     @property
     def entry_data(self):
@@ -74,132 +224,277 @@ class PushupSensor(RestoreEntity, SensorEntity):
     async def async_added_to_hass(self):
         """Restore state and register callbacks."""
         await super().async_added_to_hass()
-        state = await self.async_get_last_state()
-        if state:
-            self._min_distance = state.attributes.get(ATTR_MIN_DISTANCE)
-            self._max_distance = state.attributes.get(ATTR_MAX_DISTANCE)
+        self._coordinator = self.hass.data[DOMAIN][DATA_COORDINATOR]
+        self._stats = self.entry_data["stats"]
+        self._capture = self.entry_data.get("capture")
+        self._coalescer = WriteCoalescer(
+            self.hass, self._async_write_state, 1 / DEFAULT_MAX_UPDATE_RATE
+        )
+        if calibration := self.entry_data["calibration"]:
+            self._engine.set_calibration(*calibration)
 
-        async_track_state_change_event(
-            self.hass, self._input_entity, self._async_input_changed
+        self._parameters = self.entry_data["parameters"]
+        self.async_on_remove(
+            self._parameters.async_subscribe(self.async_update_parameters)
         )
+        self.async_update_parameters(self._parameters.parameters)
+
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, self._input_entities, self._async_input_changed
+            )
+        )
+        self.async_on_remove(self._cancel_scheduled_update)
+        self.async_on_remove(self._coalescer.async_cancel)
+
+        data = self._config_entry.data
+        if data.get(CONF_ACTUATOR_ENTITY):
+            self._actuator = ActuatorBinding(
+                self.hass,
+                data[CONF_ACTUATOR_ENTITY],
+                data.get(CONF_ACTUATOR_SERVICE) or None,
+                data.get(CONF_ACTUATOR_DELTA, DEFAULT_ACTUATOR_DELTA),
+                data.get(CONF_ACTUATOR_MAX_RATE, DEFAULT_ACTUATOR_MAX_RATE),
+            )
+            self.async_on_remove(self._actuator.async_cancel)
 
     @callback
     def _async_input_changed(self, event: Event[EventStateChangedData]) -> None:
         """Input handling."""
+        started = time.perf_counter_ns()
+        self._async_process_input(event)
+        self._stats.input_time.record(time.perf_counter_ns() - started)
+
+    @callback
+    def _async_process_input(self, event: Event[EventStateChangedData]) -> None:
+        """Feed a new input state to the engine."""
         new_state = event.data.get("new_state")
         if not new_state or new_state.state in {"unknown", "unavailable", None}:
             return
 
+        stats = self._stats
         try:
             current_distance = float(new_state.state)
         except ValueError:
+            stats.dropped += 1
             return
-
-        if self._calibrating:
-            self._update_calibration(current_distance)
+        if not isfinite(current_distance):
+            stats.dropped += 1
             return
+        stats.samples += 1
+
+        now = time.monotonic()
+        engine = self._engine
+        source = self._sources[event.data["entity_id"]]
+        raw_distance = current_distance
+        if self._fusion is not None:
+            current_distance = self._fusion.add(source, now, current_distance)
+            if current_distance is None:
+                return
+        self._last_sample_time = now
+        current_distance = engine.filter(current_distance)
+        if engine.calibrating:
+            if engine.update_calibration(current_distance):
+                self._async_publish()
+            rep = False
+        else:
+            direction = engine.direction
+            completed = engine.analytics.completed
+            rep = engine.process_sample(now, current_distance)
+            if rep:
+                self._async_rep_detected(now, new_state.last_updated.timestamp())
+                if engine.parameters.immediate_output:
+                    self._state = engine.output(now)
+                    self._async_update_actuator()
+                    self._coalescer.async_publish_now(self._publish_key())
+                self._schedule_update(UPDATE_INTERVAL)
+            elif engine.direction is not direction:
+                self._async_publish()
+            if engine.analytics.completed != completed:
+                self._async_analytics_updated()
+
+        if self._capture is not None:
+            self._capture.append(
+                int(now * 1e9),
+                raw_distance,
+                engine.direction is PushupDirection.UP,
+                rep,
+                source,
+            )
 
-        self._process_boost_detection(current_distance)
-
-    def _update_calibration(self, current_distance: float) -> None:
-        """Calibration of min max."""
-        if current_distance is None:
-            return
-        self._min_distance = (
-            min(self._min_distance, current_distance)
-            if self._min_distance
-            else current_distance
-        )
-        self._max_distance = (
-            min(max(self._max_distance, current_distance), MAX_DISTANCE)
-            if self._max_distance
-            else current_distance
+    @callback
+    def _async_rep_detected(self, rep_time: float, source_time: float | None) -> None:
+        """Handle a detected rep.
+
+        ``source_time`` is the Unix time the input sample was recorded; the
+        first state write that shows the boost measures the input to output
+        latency from it.
+        """
+        self._last_rep = dt_util.utc_from_timestamp(
+            time.time() - (time.monotonic() - rep_time)
         )
+        self._latency_source = source_time
+        self._latency_baseline = self._state
+        for rep_callback in self.entry_data["rep_callbacks"]:
+            rep_callback(rep_time)
 
-    def _process_boost_detection(self, current_distance: float) -> None:
-        """Detect pushup using calibrated values."""
-        if None in (self._min_distance, self._max_distance):
+    @callback
+    def _async_analytics_updated(self) -> None:
+        """Tell the analytics sensors a rep was measured."""
+        for analytics_callback in self.entry_data["analytics_callbacks"]:
+            analytics_callback()
+
+    @callback
+    def async_ingest_samples(self, samples: list[tuple[float, float]]) -> dict:
+        """Feed buffered ``(timestamp, distance)`` samples in one call.
+
+        Timestamps are Unix times in seconds. They are moved onto the
+        monotonic clock so reps keep the time the sample was taken. Samples
+        older than the last one processed, or not finite, are skipped. With
+        several input entities the samples count as already fused.
+        """
+        now = time.monotonic()
+        offset = now - time.time()
+        last = self._last_sample_time
+        timestamps = []
+        distances = []
+        for timestamp, distance in samples:
+            timestamp = min(timestamp + offset, now)
+            if timestamp < last or not isfinite(distance):
+                continue
+            timestamps.append(timestamp)
+            distances.append(distance)
+            last = timestamp
+        self._last_sample_time = last
+        self._stats.samples += len(timestamps)
+        self._stats.dropped += len(samples) - len(timestamps)
+
+        engine = self._engine
+        direction = engine.direction
+        completed = engine.analytics.completed
+        rep_times = engine.process_samples(timestamps, distances)
+        if engine.analytics.completed != completed:
+            self._async_analytics_updated()
+        if rep_times:
+            for rep_time in rep_times:
+                # Buffered samples say nothing about live output latency.
+                self._async_rep_detected(rep_time, None)
+            # The reps may be in the past; bring the output up to date now.
+            self._schedule_update(0)
+        elif engine.calibrating or engine.direction is not direction:
+            self._async_publish()
+        return {"samples": len(timestamps), "reps": len(rep_times)}
+
+    @callback
+    def async_update_parameters(self, parameters: PushupParameters) -> None:
+        """Apply a parameter snapshot and rebuild the values derived from it."""
+        version = self._parameters.version
+        if version == self._parameters_version:
             return
+        self._parameters_version = version
+        self._engine.set_parameters(parameters)
+        self._coalescer.min_interval = 1 / parameters.max_update_rate
 
-        # Calculate thresholds based on tolerance
-        tolerance = self.tolerance
-        lower_threshold = self._min_distance + (tolerance / 100) * (
-            self._max_distance - self._min_distance
-        )
-        upper_threshold = self._max_distance - (tolerance / 100) * (
-            self._max_distance - self._min_distance
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the state, count the write and measure rep latency."""
+        self._stats.state_writes += 1
+        self.async_write_ha_state()
+        # A boost starting at 0 leaves the state as it was; the output has
+        # only reacted once the state rises above its value before the rep.
+        if self._latency_source is not None and self._state > self._latency_baseline:
+            self._stats.latency.record(time.time() - self._latency_source)
+            self._latency_source = None
+
+    @callback
+    def _async_publish(self) -> None:
+        """Write the state if the value or an attribute changed."""
+        self._async_update_actuator()
+        self._coalescer.async_request(self._publish_key())
+
+    @callback
+    def _async_update_actuator(self) -> None:
+        """Hand the output to the bound actuator, if any."""
+        if self._actuator is not None:
+            self._actuator.async_update(
+                self.native_value, self._engine.parameters.max_value
+            )
+
+    def _publish_key(self) -> tuple:
+        """Return what a state write would publish."""
+        engine = self._engine
+        return (
+            self._state,
+            engine.direction,
+            engine.min_distance,
+            engine.max_distance,
+            engine.calibration_quality,
+            engine.calibrating,
+            self._last_rep,
         )
 
-        # Toggle direction based on thresholds
-        if (
-            self._current_direction == PushupDirection.UP
-            and current_distance <= lower_threshold
-        ):
-            self._current_direction = PushupDirection.DOWN
-            self._add_boost()
-        elif (
-            self._current_direction == PushupDirection.DOWN
-            and current_distance >= upper_threshold
-        ):
-            self._current_direction = PushupDirection.UP
-
-    def _add_boost(self):
-        """Add a new boost when a pushup is detected."""
-        self._active_boosts.append({"start_time": datetime.now(), "expired": False})
-
-    def _process_boosts(self, current_time: datetime) -> None:
-        """Update boost values with proper timing."""
-        for boost in self._active_boosts:
-            elapsed = (current_time - boost["start_time"]).total_seconds()
-            if elapsed <= self.rise_time:
-                boost["value"] = self.boost_value * (elapsed / self.rise_time)
-            elif elapsed <= self.rise_time + self.boost_time:
-                boost["value"] = self.boost_value
-            else:
-                decay_time = elapsed - self.rise_time - self.boost_time
-                boost["value"] = self.boost_value * max(
-                    0, 1 - (decay_time / self.fall_time)
-                )
+    def _schedule_update(self, delay: float | None) -> None:
+        """Have the coordinator tick this sensor after ``delay`` seconds."""
+        self._coordinator.async_schedule(self, delay)
+
+    @callback
+    def _cancel_scheduled_update(self) -> None:
+        """Stop the coordinator from ticking this sensor."""
+        self._schedule_update(None)
+
+    @callback
+    def async_tick(self, now: float) -> float | None:
+        """Advance the envelope and return seconds until the next tick."""
+        started = time.perf_counter_ns()
+        engine = self._engine
+        if engine.calibrating:
+            return None
+
+        self._state = engine.output(now)
+        self._stats.observe_boosts(len(engine.envelope))
+
+        self._async_publish()
+        delay = engine.envelope.next_update_delay(now, UPDATE_INTERVAL)
+        self._stats.tick_time.record(time.perf_counter_ns() - started)
+        return delay
 
     async def async_update(self) -> None:
-        """Update the sensor state."""
-        if self._calibrating:
-            return
+        """Update the sensor state and schedule the next update."""
+        self._schedule_update(self.async_tick(time.monotonic()))
 
-        current_time = datetime.now(tz=None)
+    @property
+    def engine(self) -> PushupEngine:
+        """Return the detection engine."""
+        return self._engine
 
-        self._process_boosts(current_time)
-        max_value = self.max_value
-        total_boost = sum(b["value"] for b in self._active_boosts)
-        self._state = min(
-            round((total_boost / 100) * max_value),
-            max_value,
-        )
-        # Cleanup expired boosts
-        self._active_boosts = [
-            b
-            for b in self._active_boosts
-            if (current_time - b["start_time"]).total_seconds()
-            <= self.rise_time + self.boost_time + self.fall_time
-        ]
+    @property
+    def fusion(self) -> SampleFusion | None:
+        """Return the fusion of several input entities, if any."""
+        return self._fusion
 
-        self.async_write_ha_state()
+    @property
+    def actuator(self) -> ActuatorBinding | None:
+        """Return the bound actuator, if any."""
+        return self._actuator
 
     @property
     def native_value(self):
         """Return the current sensor value."""
-        if self._calibrating:
+        if self._engine.calibrating:
             return 0
         return self._state
 
     @property
     def extra_state_attributes(self):
         """Return additional sensor attributes."""
+        engine = self._engine
         return {
-            ATTR_MIN_DISTANCE: self._min_distance,
-            ATTR_MAX_DISTANCE: self._max_distance,
-            ATTR_DIRECTION: self._current_direction.value,
-            ATTR_CALIBRATING: self._calibrating,
+            ATTR_MIN_DISTANCE: engine.min_distance,
+            ATTR_MAX_DISTANCE: engine.max_distance,
+            ATTR_DIRECTION: engine.direction.value,
+            ATTR_CALIBRATING: engine.calibrating,
+            ATTR_CALIBRATION_QUALITY: engine.calibration_quality,
+            ATTR_LAST_REP: self._last_rep,
         }
 
     @property
@@ -223,55 +518,257 @@ class PushupSensor(RestoreEntity, SensorEntity):
             "sw_version": SW_VERSION,
         }
 
-    @property
-    def state_class(self):
-        """Return the state class."""
-        return SensorStateClass.MEASUREMENT
-
     def start_calibration(self):
         """Start calibration."""
-        self._calibrating = True
-        self._min_distance = None
-        self._max_distance = None
-        self._active_boosts = []
+        self._engine.start_calibration()
         self._state = 0
-        self._current_direction = PushupDirection.DOWN
+        self._cancel_scheduled_update()
+        self._async_publish()
 
     def stop_calibration(self):
         """Stop calibration."""
-        self._calibrating = False
+        self._engine.stop_calibration()
+        self._async_publish()
 
     @property
     def tolerance(self):
         """Return the tolerance value."""
-        return self.entry_data.get("tolerance", DEFAULT_TOLERANCE)
+        return self._engine.parameters.tolerance
 
     @property
     def max_value(self):
         """Return the maximum value."""
-        return self.entry_data.get("max_value", DEFAULT_MAX_VALUE)
+        return self._engine.parameters.max_value
 
     @property
     def rise_time(self):
         """Return the rise time."""
-        return self.entry_data.get("rise_time", DEFAULT_RISE_TIME)
+        return self._engine.parameters.rise_time
 
     @property
     def boost_time(self):
         """Return the boost time."""
-        return self.entry_data.get("boost_time", DEFAULT_BOOST_TIME)
+        return self._engine.parameters.boost_time
 
     @property
     def fall_time(self):
         """Return the fall time."""
-        return self.entry_data.get("fall_time", DEFAULT_FALL_TIME)
+        return self._engine.parameters.fall_time
 
     @property
     def boost_value(self):
         """Return the boost value."""
-        return self.entry_data.get("boost_value", DEFAULT_BOOST_VALUE)
+        return self._engine.parameters.boost_value
 
     @property
     def is_calibrating(self):
         """Return True if the sensor is calibrating."""
-        return self._calibrating
+        return self._engine.calibrating
+
+
+class PushupRepCountSensor(RestoreSensor):
+    """Cumulative count of detected reps."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "reps"
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        self._config_entry = config_entry
+        self._attr_native_value = 0
+
+    @property
+    def entry_data(self):
+        """Return the entry data for this sensor."""
+        return self.hass.data[DOMAIN][self._config_entry.entry_id]
+
+    async def async_added_to_hass(self):
+        """Restore the count and register callbacks."""
+        await super().async_added_to_hass()
+        data = await self.async_get_last_sensor_data()
+        if data and data.native_value is not None:
+            self._attr_native_value = int(data.native_value)
+
+        self.entry_data["rep_callbacks"].append(self._async_rep_detected)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister callbacks."""
+        await super().async_will_remove_from_hass()
+        self.entry_data["rep_callbacks"].remove(self._async_rep_detected)
+
+    @callback
+    def _async_rep_detected(self, _timestamp: float) -> None:
+        """Count a detected rep."""
+        self._attr_native_value += 1
+        self.async_write_ha_state()
+
+    @property
+    def name(self):
+        """Return the sensor name."""
+        return f"{self._config_entry.data[CONF_NAME]} Reps"
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{self._config_entry.entry_id}_rep_count"
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+        }
+
+
+class PushupAnalyticsSensor(SensorEntity):
+    """One measurement of the last rep with its session aggregates."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        analytics: RepAnalytics,
+        key: str,
+        name_suffix: str,
+        unit: str,
+        digits: int,
+        value: Callable,
+        stats: Callable | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        self._config_entry = config_entry
+        self._analytics = analytics
+        self.key = key
+        self.name_suffix = name_suffix
+        self._attr_native_unit_of_measurement = unit
+        self._digits = digits
+        self._value = value
+        self._stats = stats
+
+    @property
+    def entry_data(self):
+        """Return the entry data for this sensor."""
+        return self.hass.data[DOMAIN][self._config_entry.entry_id]
+
+    async def async_added_to_hass(self):
+        """Register callbacks."""
+        await super().async_added_to_hass()
+        self.entry_data["analytics_callbacks"].append(self._async_analytics_updated)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister callbacks."""
+        await super().async_will_remove_from_hass()
+        self.entry_data["analytics_callbacks"].remove(self._async_analytics_updated)
+
+    @callback
+    def _async_analytics_updated(self) -> None:
+        """Show the measurement of the rep that just completed."""
+        analytics = self._analytics
+        value = self._value(analytics)
+        self._attr_native_value = None if value is None else round(value, self._digits)
+        if self._stats is not None:
+            self._attr_extra_state_attributes = self._stats(analytics).as_dict(
+                self._digits
+            )
+        self.async_write_ha_state()
+
+    @property
+    def name(self):
+        """Return the sensor name."""
+        return f"{self._config_entry.data[CONF_NAME]} {self.name_suffix}"
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{self._config_entry.entry_id}_{self.key}"
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+        }
+
+
+class PushupDebugSensor(SensorEntity):
+    """Diagnostic sensor showing one runtime counter of a tracker."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"p50", "p95", "p99", "histogram", "peak"})
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        key: str,
+        name_suffix: str,
+        unit: str,
+        value: Callable,
+        histogram: Callable | None = None,
+        peak: Callable | None = None,
+        latency: bool = False,
+        state_class: SensorStateClass = SensorStateClass.MEASUREMENT,
+    ) -> None:
+        """Initialize the sensor."""
+        self._config_entry = config_entry
+        self.key = key
+        self.name_suffix = name_suffix
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._value = value
+        self._histogram = histogram
+        self._peak = peak
+        self._latency = latency
+        self._previous = None
+
+    @property
+    def entry_data(self):
+        """Return the entry data for this sensor."""
+        return self.hass.data[DOMAIN][self._config_entry.entry_id]
+
+    def _rate(self, counter: int, per: float) -> float | None:
+        """Return how fast ``counter`` grew since the last update, per ``per`` s."""
+        now = time.monotonic()
+        previous = self._previous
+        self._previous = (now, counter)
+        if previous is None or now <= previous[0]:
+            return None
+        return round((counter - previous[1]) / (now - previous[0]) * per, 1)
+
+    async def async_update(self) -> None:
+        """Read the counter."""
+        stats = self.entry_data["stats"]
+        self._attr_native_value = self._value(stats, self._rate)
+        attributes = {}
+        if self._histogram is not None:
+            histogram = self._histogram(stats)
+            attributes = {
+                "p50": histogram.percentile(0.5),
+                "p99": histogram.percentile(0.99),
+                "histogram": histogram.as_dict(),
+            }
+        if self._peak is not None:
+            attributes["peak"] = self._peak(stats)
+        if self._latency:
+            attributes = stats.latency.percentiles()
+        self._attr_extra_state_attributes = attributes
+
+    @property
+    def name(self):
+        """Return the sensor name."""
+        return f"{self._config_entry.data[CONF_NAME]} {self.name_suffix}"
+
+    @property
+    def unique_id(self):
+        """Return unique ID."""
+        return f"{self._config_entry.entry_id}_{self.key}"
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+        }
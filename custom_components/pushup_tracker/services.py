@@ -0,0 +1,186 @@
+"""Services for Pushup Tracker."""
+
+from functools import partial
+import multiprocessing
+from pathlib import Path
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import (
+    ServiceValidationError,
+    Unauthorized,
+    UnknownUser,
+)
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_APPLY,
+    ATTR_CALIBRATION_TIME,
+    ATTR_CANDIDATES,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_EXPECTED_REPS,
+    ATTR_METHOD,
+    ATTR_SAMPLES,
+    ATTR_TRACE,
+    DEFAULT_TUNING_CANDIDATES,
+    DOMAIN,
+    SERVICE_INGEST_SAMPLES,
+    SERVICE_TUNE,
+    TUNING_METHODS,
+    TUNING_RESULTS,
+)
+from .fusion import SampleFusion
+from .tuning import Trace, load_trace, tune
+
+INGEST_SAMPLES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_SAMPLES): [
+            vol.ExactSequence([vol.Coerce(float), vol.Coerce(float)])
+        ],
+    }
+)
+
+TUNE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TRACE): cv.string,
+        vol.Required(ATTR_EXPECTED_REPS): cv.positive_int,
+        vol.Optional(ATTR_CALIBRATION_TIME, default=0): vol.Coerce(float),
+        vol.Optional(ATTR_METHOD, default=TUNING_METHODS[0]): vol.In(TUNING_METHODS),
+        vol.Optional(ATTR_CANDIDATES, default=DEFAULT_TUNING_CANDIDATES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=5000)
+        ),
+        vol.Optional(ATTR_APPLY, default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_get_entry_data(hass: HomeAssistant, entry_id: str) -> dict | None:
+    """Return the runtime data of a loaded Pushup Tracker entry, or None."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        return None
+    return hass.data[DOMAIN].get(entry_id)
+
+
+def _get_sensor(hass: HomeAssistant, entry_id: str):
+    """Return the tracker sensor of a config entry."""
+    entry_data = async_get_entry_data(hass, entry_id)
+    if not entry_data or "sensor" not in entry_data:
+        raise ServiceValidationError(f"No loaded Pushup Tracker entry {entry_id}")
+    return entry_data["sensor"]
+
+
+def _load_allowed_trace(hass: HomeAssistant, path: str, fusion: SampleFusion | None):
+    """Load a trace from the integration directory or an allowlisted path."""
+    # Both checks resolve the path on disk, so this runs in the executor.
+    own_dir = Path(hass.config.path(DOMAIN)).resolve()
+    own_file = Path(path).resolve().is_relative_to(own_dir)
+    if not own_file and not hass.config.is_allowed_path(path):
+        raise ServiceValidationError(f"Access to {path} is not allowed")
+    return load_trace(path, fusion)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    @callback
+    def async_ingest_samples(call: ServiceCall) -> ServiceResponse:
+        """Feed a batch of timestamped samples to a tracker."""
+        sensor = _get_sensor(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        return sensor.async_ingest_samples(call.data[ATTR_SAMPLES])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_INGEST_SAMPLES,
+        async_ingest_samples,
+        schema=INGEST_SAMPLES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_tune(call: ServiceCall) -> ServiceResponse:
+        """Search the best parameters for a labelled trace."""
+        # Tuning runs a process pool and can overwrite the live parameters, so
+        # it is limited to administrators like an admin service. The helper
+        # for those cannot register a service that returns a response.
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None:
+                raise UnknownUser(context=call.context)
+            if not user.is_admin:
+                raise Unauthorized(context=call.context)
+
+        sensor = _get_sensor(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        path = hass.config.path(call.data[ATTR_TRACE])
+        # Captures of several inputs are replayed through an empty fusion with
+        # the live settings.
+        fusion = sensor.fusion
+        if fusion is not None:
+            fusion = SampleFusion(fusion.weights, fusion.method, fusion.max_age)
+        try:
+            timestamps, distances = await hass.async_add_executor_job(
+                _load_allowed_trace, hass, path, fusion
+            )
+        except (OSError, ValueError) as err:
+            raise ServiceValidationError(f"Cannot read trace {path}: {err}") from err
+
+        engine = sensor.engine
+        calibration_time = call.data[ATTR_CALIBRATION_TIME]
+        calibration_range = None
+        if not calibration_time:
+            if engine.min_distance is None or engine.max_distance is None:
+                raise ServiceValidationError(
+                    "Calibrate the tracker or give a calibration time"
+                )
+            calibration_range = (engine.min_distance, engine.max_distance)
+        trace = Trace(
+            timestamps,
+            distances,
+            call.data[ATTR_EXPECTED_REPS],
+            calibration_time,
+            calibration_range,
+        )
+        # Worker processes are spawned; forking the running instance is unsafe.
+        results = await hass.async_add_executor_job(
+            partial(
+                tune,
+                trace,
+                engine.parameters,
+                call.data[ATTR_METHOD],
+                call.data[ATTR_CANDIDATES],
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        )
+        if not results:
+            raise ServiceValidationError("No parameter set could be evaluated")
+
+        best = results[0]
+        if call.data[ATTR_APPLY]:
+            sensor.entry_data["parameters"].async_update(best.values)
+        return {
+            "applied": call.data[ATTR_APPLY],
+            "results": [result.as_dict() for result in results[:TUNING_RESULTS]],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TUNE,
+        async_tune,
+        schema=TUNE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
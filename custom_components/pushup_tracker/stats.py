@@ -0,0 +1,142 @@
+"""Runtime counters for Pushup Tracker."""
+
+from array import array
+
+from .const import LATENCY_WINDOW
+
+HISTOGRAM_BUCKETS = 16
+
+
+class RunTimeHistogram:
+    """Power-of-two histogram of run times.
+
+    Bucket 0 counts runs under 1.024 µs and bucket ``n`` runs under
+    ``1.024 * 2**n`` µs; the last bucket also takes everything slower.
+    ``total_ns`` adds up every run.
+    """
+
+    __slots__ = ("counts", "total_ns")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.counts = array("Q", bytes(8 * HISTOGRAM_BUCKETS))
+        self.total_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        """Count one run."""
+        self.total_ns += duration_ns
+        bucket = (duration_ns >> 10).bit_length()
+        self.counts[
+            bucket if bucket < HISTOGRAM_BUCKETS else HISTOGRAM_BUCKETS - 1
+        ] += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return an upper bound of the given percentile in microseconds."""
+        total = sum(self.counts)
+        if not total:
+            return None
+        target = fraction * total
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                break
+        return round(1.024 * 2**bucket, 3)
+
+    def as_dict(self) -> dict:
+        """Return the histogram keyed by bucket upper bound in microseconds."""
+        return {
+            f"<{1.024 * 2**bucket:g}us": count
+            for bucket, count in enumerate(self.counts)
+            if count
+        }
+
+
+class LatencyWindow:
+    """Ring of the most recent latencies with on-demand percentiles."""
+
+    __slots__ = ("_values", "_index", "count")
+
+    def __init__(self, size: int = LATENCY_WINDOW) -> None:
+        """Initialize the window."""
+        self._values = array("d", bytes(8 * size))
+        self._index = 0
+        self.count = 0
+
+    def record(self, latency: float) -> None:
+        """Add one latency in seconds."""
+        self._values[self._index] = latency
+        self._index = (self._index + 1) % len(self._values)
+        self.count += 1
+
+    def percentiles(self) -> dict[str, float]:
+        """Return p50/p95/p99 of the window in milliseconds."""
+        size = min(self.count, len(self._values))
+        if not size:
+            return {}
+        ordered = sorted(self._values[:size])
+        return {
+            name: round(ordered[round((size - 1) * fraction)] * 1000, 1)
+            for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+        }
+
+
+class TrackerStats:
+    """Counters cheap enough to keep on in production.
+
+    Everything is preallocated; recording only bumps integers.
+    """
+
+    __slots__ = (
+        "samples",
+        "dropped",
+        "state_writes",
+        "boosts",
+        "peak_boosts",
+        "input_time",
+        "tick_time",
+        "latency",
+        "restore_time",
+        "setup_time",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.samples = 0
+        self.dropped = 0
+        self.state_writes = 0
+        self.boosts = 0
+        self.peak_boosts = 0
+        self.input_time = RunTimeHistogram()
+        self.tick_time = RunTimeHistogram()
+        self.latency = LatencyWindow()
+        self.restore_time = None
+        self.setup_time = None
+
+    def observe_boosts(self, boosts: int) -> None:
+        """Record the current number of live boosts."""
+        self.boosts = boosts
+        if boosts > self.peak_boosts:
+            self.peak_boosts = boosts
+
+    def as_dict(self) -> dict:
+        """Return the counters for diagnostics."""
+        return {
+            "samples": self.samples,
+            "dropped": self.dropped,
+            "state_writes": self.state_writes,
+            "boosts": self.boosts,
+            "peak_boosts": self.peak_boosts,
+            "input_time": self.input_time.as_dict(),
+            "tick_time": self.tick_time.as_dict(),
+            "latency_ms": self.latency.percentiles(),
+            "startup_ms": {
+                "restore": _ms(self.restore_time),
+                "setup": _ms(self.setup_time),
+            },
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Return seconds as rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
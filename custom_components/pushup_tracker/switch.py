@@ -1,11 +1,17 @@
 """Switch platform for Pushup Tracker."""
 
+import asyncio
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SENSOR_READY_TIMEOUT
+from .parameters import PushupParameters
 
 
 async def async_setup_entry(
@@ -14,10 +20,29 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up switches."""
-    sensor = hass.data[DOMAIN][entry.entry_id]["sensor"]
+    # Platforms are set up concurrently; wait for the sensor platform.
+    try:
+        async with asyncio.timeout(SENSOR_READY_TIMEOUT):
+            sensor = await asyncio.shield(
+                hass.data[DOMAIN][entry.entry_id]["sensor_ready"]
+            )
+    except TimeoutError as err:
+        raise PlatformNotReady("The tracker sensor was not set up") from err
     async_add_entities(
         [
             CalibrationSwitch(entry, sensor),
+            ConfigSwitch(
+                entry,
+                key="immediate_output",
+                name_suffix="Immediate Output",
+                unique_id_suffix="immediate_output",
+            ),
+            ConfigSwitch(
+                entry,
+                key="adaptive_thresholds",
+                name_suffix="Adaptive Thresholds",
+                unique_id_suffix="adaptive_thresholds",
+            ),
         ]
     )
 
@@ -61,3 +86,73 @@ class CalibrationSwitch(SwitchEntity):
         """Handle the switch being turned off."""
         self._sensor.stop_calibration()
         self.async_write_ha_state()
+
+
+class ConfigSwitch(RestoreEntity, SwitchEntity):
+    """A generic switch entity for configuration parameters."""
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        key: str,
+        name_suffix: str,
+        unique_id_suffix: str,
+    ) -> None:
+        """Initialize the switch."""
+        self._config_entry = config_entry
+        self.key = key
+        self.name_suffix = name_suffix
+        self.unique_id_suffix = unique_id_suffix
+
+    @property
+    def entry_data(self):
+        """Return the entry data for this switch."""
+        return self.hass.data[DOMAIN][self._config_entry.entry_id]
+
+    async def async_added_to_hass(self):
+        """Follow the parameter store, which starts with the restored value."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.entry_data["parameters"].async_subscribe(
+                self._async_parameters_changed
+            )
+        )
+
+    @callback
+    def _async_parameters_changed(self, parameters: PushupParameters) -> None:
+        """Write the state after the parameters changed."""
+        self.async_write_ha_state()
+
+    @property
+    def name(self):
+        """Return the name of the switch."""
+        return f"{self._config_entry.data[CONF_NAME]} {self.name_suffix}"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID for the switch."""
+        return f"{self._config_entry.entry_id}_{self.unique_id_suffix}"
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+        }
+
+    @property
+    def is_on(self):
+        """Return True if the switch is on."""
+        return self.entry_data["parameters"][self.key]
+
+    async def async_turn_on(self, **kwargs):
+        """Turn the option on."""
+        await self._async_set(True)
+
+    async def async_turn_off(self, **kwargs):
+        """Turn the option off."""
+        await self._async_set(False)
+
+    async def _async_set(self, value: bool) -> None:
+        """Store the value; the sensor picks it up with the next notification."""
+        self.entry_data["parameters"].async_set(self.key, value)
@@ -0,0 +1,237 @@
+"""Offline auto-tuning of the detection and envelope parameters.
+
+Candidates are drawn from the ranges of the number entities and replayed
+through the engine's batch path against a trace with a known rep count. They
+rank by rep count error first, then by whether the output uses its range,
+reaching at least half of the maximum without sitting there, then by output
+roughness. Roughness is the mean absolute second
+difference of the output relative to its mean, so it does not depend on the
+output scale, and a flat output ranks last.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from dataclasses import dataclass, field, replace
+import itertools
+import math
+import os
+from pathlib import Path
+import random
+
+from .capture import read_records
+from .engine import PushupEngine
+from .fusion import SampleFusion
+from .parameters import PushupParameters
+
+TICK_INTERVAL = 0.1  # seconds between output evaluations, like the live updates
+
+# Parameter: (minimum, maximum, step), matching the number entities.
+SEARCH_SPACE = {
+    "tolerance": (0, 30, 1),
+    "rise_time": (0, 5, 0.1),
+    "boost_time": (0, 5, 0.1),
+    "fall_time": (0, 5, 0.1),
+    "boost_value": (0, 100, 1),
+}
+GRID_POINTS = 4  # values per parameter in a grid search
+MAX_SATURATION = 0.1  # share of time the output may sit at its maximum
+MIN_PEAK = 0.5  # share of the maximum the output has to reach
+
+
+@dataclass(frozen=True, slots=True)
+class Trace:
+    """A distance trace with its true rep count."""
+
+    timestamps: list[float]
+    distances: list[float]
+    expected_reps: int
+    # Seconds at the start of the trace to calibrate on, or a fixed range.
+    calibration_time: float = 0.0
+    calibration_range: tuple[float, float] | None = None
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class TuningResult:
+    """How one candidate did on the trace."""
+
+    rep_error: int
+    out_of_range: bool
+    roughness: float
+    reps: int = field(compare=False)
+    peak: float = field(compare=False)
+    saturation: float = field(compare=False)
+    values: dict = field(compare=False)
+
+    def as_dict(self) -> dict:
+        """Return the result for a service response."""
+        return {
+            **self.values,
+            "reps": self.reps,
+            "rep_error": self.rep_error,
+            "peak": self.peak,
+            "saturation": round(self.saturation, 4),
+            "roughness": (
+                round(self.roughness, 4) if math.isfinite(self.roughness) else None
+            ),
+        }
+
+
+def load_trace(
+    path: str | Path, fusion: SampleFusion | None = None
+) -> tuple[list[float], list[float]]:
+    """Load ``timestamp,distance`` rows from a CSV or a raw capture file.
+
+    A capture of several input entities is replayed through ``fusion``, or an
+    equal weight median when it is None, to rebuild the detection samples.
+    """
+    path = Path(path)
+    if path.suffix == ".bin":
+        records = list(read_records(path.read_bytes()))
+        sources = max((r[4] for r in records), default=0) + 1
+        if sources == 1:
+            return [r[0] / 1e9 for r in records], [r[1] for r in records]
+        if fusion is None:
+            fusion = SampleFusion((1.0,) * sources)
+        timestamps = []
+        distances = []
+        for unix_ns, distance, _, _, source in records:
+            timestamp = unix_ns / 1e9
+            fused = fusion.add(source, timestamp, distance)
+            if fused is not None:
+                timestamps.append(timestamp)
+                distances.append(fused)
+        return timestamps, distances
+    timestamps = []
+    distances = []
+    with path.open(newline="", encoding="utf-8") as file:
+        for row in csv.reader(file):
+            try:
+                timestamp, distance = float(row[0]), float(row[1])
+            except (IndexError, ValueError):
+                continue
+            timestamps.append(timestamp)
+            distances.append(distance)
+    return timestamps, distances
+
+
+def _snap(value: float, low: float, step: float) -> float:
+    """Round ``value`` onto the entity step grid."""
+    return round(low + round((value - low) / step) * step, 6)
+
+
+def candidates(method: str, samples: int, seed: int = 0) -> list[dict]:
+    """Return the parameter sets to try, by ``grid`` or ``random`` search."""
+    if method == "grid":
+        axes = [
+            [
+                _snap(low + (high - low) * index / (GRID_POINTS - 1), low, step)
+                for index in range(GRID_POINTS)
+            ]
+            for low, high, step in SEARCH_SPACE.values()
+        ]
+        sets = [dict(zip(SEARCH_SPACE, values)) for values in itertools.product(*axes)]
+    else:
+        rng = random.Random(seed)
+        sets = [
+            {
+                key: _snap(rng.uniform(low, high), low, step)
+                for key, (low, high, step) in SEARCH_SPACE.items()
+            }
+            for _ in range(samples)
+        ]
+    return [
+        values
+        for values in sets
+        if values["rise_time"] + values["boost_time"] + values["fall_time"] > 0
+    ]
+
+
+def evaluate(trace: Trace, values: dict, base: PushupParameters) -> TuningResult:
+    """Replay the trace with one parameter set."""
+    engine = PushupEngine(replace(base, **values))
+    timestamps, distances = trace.timestamps, trace.distances
+    if trace.calibration_range is not None:
+        engine.set_calibration(*trace.calibration_range)
+        split = 0
+    else:
+        end = timestamps[0] + trace.calibration_time if timestamps else 0
+        split = next(
+            (index for index, value in enumerate(timestamps) if value >= end),
+            len(timestamps),
+        )
+        engine.start_calibration()
+        engine.process_samples(timestamps[:split], distances[:split])
+        engine.stop_calibration()
+    rep_times = engine.process_samples(timestamps[split:], distances[split:])
+
+    roughness = math.inf
+    peak = saturation = 0.0
+    if len(timestamps) > split:
+        start = timestamps[split]
+        ticks = int((timestamps[-1] - start) / TICK_INTERVAL) + 1
+        grid = [start + index * TICK_INTERVAL for index in range(ticks)]
+        output = [float(value) for value in engine.envelope_output(rep_times, grid)]
+        mean = sum(output) / len(output)
+        max_value = engine.parameters.max_value
+        peak = max(output)
+        saturation = sum(value >= max_value for value in output) / len(output)
+        if mean > 0 and len(output) > 2:
+            jerk = sum(
+                abs(output[i + 1] - 2 * output[i] + output[i - 1])
+                for i in range(1, len(output) - 1)
+            )
+            roughness = jerk / (len(output) - 2) / mean
+    return TuningResult(
+        rep_error=abs(len(rep_times) - trace.expected_reps),
+        out_of_range=(
+            saturation > MAX_SATURATION or peak < MIN_PEAK * engine.parameters.max_value
+        ),
+        roughness=roughness,
+        reps=len(rep_times),
+        peak=peak,
+        saturation=saturation,
+        values=values,
+    )
+
+
+_worker_trace = None
+_worker_base = None
+
+
+def _init_worker(trace: Trace, base: PushupParameters) -> None:
+    """Receive the trace once per worker process."""
+    global _worker_trace, _worker_base  # noqa: PLW0603
+    _worker_trace, _worker_base = trace, base
+
+
+def _evaluate_in_worker(values: dict) -> TuningResult:
+    """Evaluate one candidate against the worker's trace."""
+    return evaluate(_worker_trace, values, _worker_base)
+
+
+def tune(
+    trace: Trace,
+    base: PushupParameters | None = None,
+    method: str = "random",
+    samples: int = 200,
+    seed: int = 0,
+    workers: int | None = None,
+    mp_context=None,
+) -> list[TuningResult]:
+    """Search the parameter space across processes; return results best first.
+
+    ``base`` supplies the parameters that are not searched, such as the
+    input filter. ``workers`` defaults to one process per core.
+    """
+    base = base or PushupParameters()
+    sets = candidates(method, samples, seed)
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(trace, base),
+    ) as executor:
+        chunksize = max(1, len(sets) // (4 * workers))
+        results = list(executor.map(_evaluate_in_worker, sets, chunksize=chunksize))
+    return sorted(results)
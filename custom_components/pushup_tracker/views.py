@@ -0,0 +1,45 @@
+"""HTTP views for Pushup Tracker."""
+
+from http import HTTPStatus
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+
+from .capture import to_csv
+from .services import async_get_entry_data
+
+
+class PushupCaptureView(HomeAssistantView):
+    """Download the raw sample capture of a tracker.
+
+    The binary ring file is returned as is; ``?format=csv`` returns the
+    records oldest first instead.
+    """
+
+    url = "/api/pushup_tracker/capture/{entry_id}"
+    name = "api:pushup_tracker:capture"
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        """Return the capture."""
+        hass = request.app[KEY_HASS]
+        entry_data = async_get_entry_data(hass, entry_id)
+        if not entry_data or "capture" not in entry_data:
+            return self.json_message("No capture for this entry", HTTPStatus.NOT_FOUND)
+
+        # Copy in the event loop, where records are written, for a consistent view.
+        data = entry_data["capture"].snapshot()
+        if request.query.get("format") == "csv":
+            body = await hass.async_add_executor_job(to_csv, data)
+            return web.Response(
+                text=body,
+                content_type="text/csv",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{entry_id}.csv"'
+                },
+            )
+        return web.Response(
+            body=data,
+            content_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{entry_id}.bin"'},
+        )
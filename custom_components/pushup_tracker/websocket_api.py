@@ -0,0 +1,109 @@
+"""Websocket API for Pushup Tracker."""
+
+from datetime import datetime, timedelta
+import time
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    DEFAULT_STREAM_RATE,
+    MAX_STREAM_RATE,
+    MAX_STREAM_REPS,
+)
+from .services import async_get_entry_data
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "pushup_tracker/subscribe",
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Optional("rate", default=DEFAULT_STREAM_RATE): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=MAX_STREAM_RATE)
+        ),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Stream the output of a tracker at the rate the client asks for.
+
+    Each frame samples the envelope at the moment it is sent and carries the
+    reps detected since the previous frame, so nothing queues up for a slow
+    client: values between two frames are dropped. Frames are skipped while
+    nothing changes.
+    """
+    entry_id = msg[ATTR_CONFIG_ENTRY_ID]
+    entry_data = async_get_entry_data(hass, entry_id)
+    if not entry_data or "sensor" not in entry_data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Tracker not loaded"
+        )
+        return
+
+    sensor = entry_data["sensor"]
+    rep_times = []
+    last_frame = None
+
+    @callback
+    def async_rep(rep_time: float) -> None:
+        """Remember a rep for the next frame."""
+        if len(rep_times) < MAX_STREAM_REPS:
+            rep_times.append(rep_time)
+
+    @callback
+    def async_send_frame(_now: datetime) -> None:
+        """Send the latest output, direction and reps."""
+        nonlocal last_frame
+        if async_get_entry_data(hass, entry_id) is not entry_data:
+            # The entry was unloaded or reloaded; the client has to resubscribe.
+            connection.subscriptions.pop(msg["id"])()
+            return
+        engine = sensor.engine
+        now = time.monotonic()
+        value = 0 if engine.calibrating else engine.output(now)
+        frame = (value, engine.direction.value, engine.calibrating)
+        if frame == last_frame and not rep_times:
+            return
+        last_frame = frame
+        offset = time.time() - now
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"],
+                {
+                    "t": round(now + offset, 3),
+                    "v": value,
+                    "d": frame[1],
+                    "c": frame[2],
+                    "reps": [round(rep + offset, 3) for rep in rep_times],
+                },
+            )
+        )
+        rep_times.clear()
+
+    rep_callbacks = entry_data["rep_callbacks"]
+    rep_callbacks.append(async_rep)
+    unsub_timer = async_track_time_interval(
+        hass, async_send_frame, timedelta(seconds=1 / msg["rate"])
+    )
+
+    @callback
+    def async_unsubscribe() -> None:
+        """Stop streaming."""
+        unsub_timer()
+        if async_rep in rep_callbacks:
+            rep_callbacks.remove(async_rep)
+
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])